@@ -95,6 +95,7 @@ def main():
     parser.add_argument("--max-workers", type=int, help="Maximum number of worker threads")
     parser.add_argument("--max-scrapers", type=int, help="Maximum number of concurrent scrapers")
     parser.add_argument("--disk-overhead-threshold", type=float, help="Disk space overhead threshold")
+    parser.add_argument("--rebuild-index", action="store_true", help="Rebuild the index of objects already in the storage bucket and exit")
     
     args = parser.parse_args()
     
@@ -109,15 +110,26 @@ def main():
         return 1
     
     # Initialize components
+    batch_processor = None
     try:
-        # Initialize validation pipeline
-        validation_config = config.get("validators", {})
-        validation_pipeline = ValidationPipeline(validation_config)
-        
         # Initialize cloud storage uploader if needed
         storage_config = config.get("storage", {})
         cloud_uploader = CloudStorageUploader(storage_config)
         
+        # Rebuilding the index only needs storage, so skip loading the validators
+        if args.rebuild_index:
+            indexed = cloud_uploader.rebuild_index()
+            cloud_uploader.close()
+            if indexed < 0:
+                logger.error("Failed to rebuild storage index")
+                return 1
+            logger.info(f"Rebuilt storage index with {indexed} objects")
+            return 0
+        
+        # Initialize validation pipeline
+        validation_config = config.get("validators", {})
+        validation_pipeline = ValidationPipeline(validation_config)
+        
         # Initialize batch processor
         batch_config = config.get("batch", {})
         
@@ -198,6 +210,7 @@ def main():
             total_processed = 0
             total_validated = 0
             total_uploaded = 0
+            total_streamed = 0
             total_duration = 0.0
 
             if len(sources) > 1:
@@ -232,6 +245,7 @@ def main():
                         total_processed += result.get("videos_downloaded", 0)
                         total_validated += result.get("videos_validated", 0)
                         total_uploaded += result.get("videos_uploaded", 0)
+                        total_streamed += result.get("videos_streamed", 0)
                         total_duration += result.get("video_hours", 0)
                     else:
                         logger.error(f"Batch processing failed for source {source}: {result.get('error', 'Unknown error')}")
@@ -256,6 +270,7 @@ def main():
                     total_processed = result.get("videos_downloaded", 0)
                     total_validated = result.get("videos_validated", 0)
                     total_uploaded = result.get("videos_uploaded", 0)
+                    total_streamed = result.get("videos_streamed", 0)
                     total_duration = result.get("video_hours", 0)
                 else:
                     logger.error(f"Batch processing failed: {result.get('error', 'Unknown error')}")
@@ -270,6 +285,8 @@ def main():
             logger.info(f"Total videos validated: {total_validated}")
             logger.info(f"Total videos failed validation: {total_failed}")
             logger.info(f"Total videos uploaded: {total_uploaded}")
+            if total_streamed:
+                logger.info(f"Total videos streamed without validation: {total_streamed}")
             logger.info(f"Total video duration: {total_duration:.2f} hours")
             logger.info("------------------------------")
 
@@ -278,6 +295,9 @@ def main():
     except Exception as e:
         logger.exception(f"Error in pipeline: {str(e)}")
         return 1
+    finally:
+        if batch_processor is not None:
+            batch_processor.close()
 
 if __name__ == "__main__":
     start_time = time.time()
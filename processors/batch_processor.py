@@ -14,10 +14,11 @@ from scrapers.base_scraper import BaseScraper
 from validators.validation_pipeline import ValidationPipeline
 from storage.cloud_storage import CloudStorageUploader
 from processors.video_processor import trim_video
+from processors.state_persistence import DebouncedStateMixin
 
 logger = logging.getLogger(__name__)
 
-class BatchProcessor:
+class BatchProcessor(DebouncedStateMixin):
     """Module for batch processing of videos through the pipeline."""
     
     def __init__(self, config: Dict[str, Any]):
@@ -48,6 +49,7 @@ class BatchProcessor:
         # Configure state tracking
         self.state_file = config.get("state_file", "batch_state.json")
         self.state = self._load_state()
+        self._init_state_persistence(config)
         
         # Initialize components
         self.validation_pipeline = None
@@ -82,6 +84,7 @@ class BatchProcessor:
         self,
         source: str,
         query: str = "nature",
+        max_videos: Optional[int] = None,
         batch_size: int = 10,
         target_hours: float = 1.0,
         output_destination: str = "local",
@@ -96,6 +99,7 @@ class BatchProcessor:
         Args:
             source: Source name (must match a registered scraper).
             query: Search query string for videos (default: "nature").
+            max_videos: Maximum number of videos to collect; None takes every search result.
             batch_size: Number of videos to process per batch (default: 10).
             target_hours: Target number of hours of video to collect (default: 1.0).
             output_destination: Where to store output, either 'local' or 'cloud' (default: "local").
@@ -226,7 +230,7 @@ class BatchProcessor:
             # Update final batch state
             batch_state["end_time"] = time.time()
             batch_state["status"] = "completed"
-            self._save_state()
+            self._save_state(force=True)
             
             self.logger.info(f"Batch processing completed for {source}, query: {query}")
 
@@ -268,7 +272,7 @@ class BatchProcessor:
                 self.state["batches"][batch_id]["status"] = "failed"
                 self.state["batches"][batch_id]["error"] = str(e)
                 self.state["batches"][batch_id]["end_time"] = time.time()
-                self._save_state()
+                self._save_state(force=True)
             
             return {"success": False, "error": str(e)}
     
@@ -492,18 +496,6 @@ class BatchProcessor:
                 "last_updated": time.time()
             }
     
-    def _save_state(self):
-        """Save batch processing state to file."""
-        try:
-            # Update last updated timestamp
-            self.state["last_updated"] = time.time()
-            
-            with open(self.state_file, "w") as f:
-                json.dump(self.state, f, indent=2)
-                
-        except Exception as e:
-            self.logger.warning(f"Error saving batch state: {str(e)}")
-    
     def get_batch_status(self, batch_id: str) -> Dict[str, Any]:
         """
         Get status of a specific batch.
@@ -552,7 +544,7 @@ class BatchProcessor:
         """Clean up temporary files and resources."""
         try:
             # Save final state
-            self._save_state()
+            self._save_state(force=True)
             
         except Exception as e:
             self.logger.error(f"Error in cleanup: {str(e)}")
@@ -18,10 +18,11 @@ from scrapers.parallel_scraper_manager import ParallelScraperManager
 from validators.validation_pipeline import ValidationPipeline
 from storage.cloud_storage import CloudStorageUploader
 from processors.video_processor import trim_video
+from processors.state_persistence import DebouncedStateMixin
 
 logger = logging.getLogger(__name__)
 
-class EnhancedBatchProcessor:
+class EnhancedBatchProcessor(DebouncedStateMixin):
     """Enhanced module for batch processing of videos through the pipeline with improved controls."""
     
     def __init__(self, config: Dict[str, Any]):
@@ -58,10 +59,15 @@ class EnhancedBatchProcessor:
         # Configure output destination
         self.output_destination = config.get("output_destination", "local")  # "local" or "cloud"
         self.cloud_bucket = config.get("cloud_bucket", "")
+        # Pipe downloads from scrapers that support it straight into cloud storage.
+        # Off by default: streamed videos never reach local disk, so they skip validation
+        # and are counted apart from the validated hours that target_hours refers to.
+        self.stream_to_cloud = config.get("stream_to_cloud", False)
         
         # Configure state tracking
         self.state_file = config.get("state_file", "logs/batch_state.json")
         self.state = self._load_state()
+        self._init_state_persistence(config)
         
         # Initialize components
         self.validation_pipeline = None
@@ -80,6 +86,8 @@ class EnhancedBatchProcessor:
         
         # Tracking variables
         self.total_video_seconds = 0
+        self.total_streamed_seconds = 0
+        self.total_videos_streamed = 0
         self.total_videos_processed = 0
         self.total_videos_validated = 0
         self.total_videos_uploaded = 0
@@ -123,24 +131,19 @@ class EnhancedBatchProcessor:
             "validated_videos": set() # Initialize as an empty set
         }
     
-    def _save_state(self):
-        """Save batch processing state to file."""
-        try:
-            # Update global counters
-            self.state["total_videos_processed"] = self.total_videos_processed
-            self.state["total_videos_validated"] = self.total_videos_validated
-            self.state["total_videos_uploaded"] = self.total_videos_uploaded
-            self.state["total_videos_failed"] = self.total_videos_failed
-            self.state["total_video_seconds"] = self.total_video_seconds
-            
-            # Convert set to list for JSON serialization
-            state_to_save = self.state.copy()
-            state_to_save['validated_videos'] = list(self.state.get('validated_videos', set()))
-
-            with open(self.state_file, "w") as f:
-                json.dump(state_to_save, f, indent=2)
-        except Exception as e:
-            self.logger.error(f"Error saving state: {str(e)}")
+    def _state_snapshot(self) -> Dict[str, Any]:
+        """Return the state to save, with the global counters and validated videos."""
+        # Update global counters
+        self.state["total_videos_processed"] = self.total_videos_processed
+        self.state["total_videos_validated"] = self.total_videos_validated
+        self.state["total_videos_uploaded"] = self.total_videos_uploaded
+        self.state["total_videos_failed"] = self.total_videos_failed
+        self.state["total_video_seconds"] = self.total_video_seconds
+        
+        # Convert set to list for JSON serialization
+        state_to_save = self.state.copy()
+        state_to_save['validated_videos'] = list(self.state.get('validated_videos', set()))
+        return state_to_save
     
     def _ensure_disk_space(self) -> bool:
         """
@@ -330,7 +333,9 @@ class EnhancedBatchProcessor:
                 "videos_validated": 0,
                 "videos_uploaded": 0,
                 "videos_failed": 0,
+                "videos_streamed": 0,
                 "video_seconds": 0,
+                "streamed_seconds": 0,
                 "status": "running"
             }
             
@@ -345,6 +350,8 @@ class EnhancedBatchProcessor:
             self.total_videos_uploaded = 0
             self.total_videos_failed = 0
             self.total_video_seconds = 0
+            self.total_streamed_seconds = 0
+            self.total_videos_streamed = 0
             self.shutdown_flag.clear()
             
             # Ensure disk space
@@ -352,7 +359,7 @@ class EnhancedBatchProcessor:
                 batch_state["status"] = "failed"
                 batch_state["error"] = "Insufficient disk space"
                 batch_state["end_time"] = time.time()
-                self._save_state()
+                self._save_state(force=True)
                 return {"success": False, "error": "Insufficient disk space"}
             
             # Initialize accumulators for multi-round scraping/processing
@@ -360,11 +367,13 @@ class EnhancedBatchProcessor:
             validated_count = 0
             uploaded_count = 0
             failed_count = 0
+            streamed_count = 0
             total_videos_found = 0
             # Loop until enough validated video duration has been collected
             expected_seconds = self.target_hours * 3600
             while self.total_video_seconds < expected_seconds and not self.shutdown_flag.is_set():
                 self.logger.info("Running additional scraping round...")
+                round_start_seconds = self.total_video_seconds
                 videos = self.parallel_scraper_manager.run_scrapers_until_target(valid_sources, self.target_hours)
                 # Filter: allow all Coverr & Wikimedia videos; others must have URLs ending in .mp4
                 filtered_videos = []
@@ -435,20 +444,28 @@ class EnhancedBatchProcessor:
                     validated_count += batch_results["validated"]
                     uploaded_count += batch_results["uploaded"]
                     failed_count += batch_results["failed"]
+                    streamed_count += batch_results["streamed"]
                     # Update batch state
                     batch_state["videos_downloaded"] = processed_count
                     batch_state["videos_validated"] = validated_count
                     batch_state["videos_uploaded"] = uploaded_count
                     batch_state["videos_failed"] = failed_count
+                    batch_state["videos_streamed"] = streamed_count
                     batch_state["video_seconds"] = self.total_video_seconds
+                    batch_state["streamed_seconds"] = self.total_streamed_seconds
                     self._save_state()
                 # End of batch round
+                if self.total_video_seconds == round_start_seconds:
+                    # Rescraping would return the same videos, e.g. ones that were only streamed
+                    self.logger.warning("No validated video time added in this round, stopping")
+                    break
             batch_state["videos_found"] = total_videos_found
             # Update final batch state
             batch_state["end_time"] = time.time()
             batch_state["status"] = "completed"
             batch_state["video_seconds"] = self.total_video_seconds
-            self._save_state()
+            batch_state["streamed_seconds"] = self.total_streamed_seconds
+            self._save_state(force=True)
             self.logger.info(f"Batch processing completed: {validated_count} videos validated, {self.total_video_seconds/3600:.2f} hours")
             # Final cleanup
             self._cleanup_temp_files()
@@ -460,8 +477,10 @@ class EnhancedBatchProcessor:
                 "videos_validated": batch_state["videos_validated"],
                 "videos_uploaded": batch_state["videos_uploaded"],
                 "videos_failed": batch_state["videos_failed"],
+                "videos_streamed": batch_state["videos_streamed"],
                 "video_seconds": self.total_video_seconds,
                 "video_hours": self.total_video_seconds / 3600,
+                "streamed_seconds": self.total_streamed_seconds,
                 "duration": batch_state["end_time"] - batch_state["start_time"]
             }
             
@@ -473,7 +492,7 @@ class EnhancedBatchProcessor:
                 self.state["batches"][batch_id]["status"] = "failed"
                 self.state["batches"][batch_id]["error"] = str(e)
                 self.state["batches"][batch_id]["end_time"] = time.time()
-                self._save_state()
+                self._save_state(force=True)
             
             return {"success": False, "error": str(e)}
     
@@ -492,14 +511,21 @@ class EnhancedBatchProcessor:
             "validated": 0,
             "uploaded": 0,
             "failed": 0,
-            "seconds": 0
+            "seconds": 0,
+            "streamed": 0,
+            "streamed_seconds": 0
         }
         
         # Use thread pool for parallel processing to avoid pickling issues
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit download tasks
+            # Submit download tasks, streaming the videos that can skip the local copy
             download_futures = {}
+            stream_futures = {}
             for video in videos:
+                if self._can_stream(video):
+                    future = executor.submit(self._stream_video, video)
+                    stream_futures[future] = video
+                    continue
                 future = executor.submit(self._download_video, video)
                 download_futures[future] = video
             
@@ -557,9 +583,82 @@ class EnhancedBatchProcessor:
                     results["failed"] += 1
                     # Clean up failed video
                     self._safe_cleanup(path)
+            
+            # Streamed videos went straight to cloud storage without validation,
+            # so they are kept out of the validated counts and seconds
+            for future in as_completed(stream_futures):
+                video = stream_futures[future]
+                stream_result = future.result()
+                
+                if stream_result["success"]:
+                    results["streamed"] += 1
+                    results["streamed_seconds"] += video.get("duration", 0)
+                    self.total_videos_streamed += 1
+                    self.total_streamed_seconds += video.get("duration", 0)
+                else:
+                    results["failed"] += 1
         
         return results
     
+    def _can_stream(self, video: Dict[str, Any]) -> bool:
+        """
+        Check whether a video can be streamed straight into cloud storage.
+        
+        Args:
+            video: Video metadata dictionary
+            
+        Returns:
+            True if streaming is enabled and the video's scraper supports it
+        """
+        if not self.stream_to_cloud or self.output_destination != "cloud" or not self.cloud_uploader:
+            return False
+        scraper = self.scrapers.get(video.get("source", "unknown"))
+        video_url = video.get("url", "")
+        return hasattr(scraper, "stream_to_cloud") and bool(video_url) and not os.path.exists(video_url)
+    
+    def _stream_video(self, video: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Stream a video from its source into cloud storage without a local copy.
+        
+        Args:
+            video: Video metadata dictionary
+            
+        Returns:
+            Dictionary with upload result
+        """
+        result = {
+            "success": False,
+            "error": None
+        }
+        
+        try:
+            source = video.get("source", "unknown")
+            video_id = video.get("id", "unknown")
+            
+            # Use the same file name a download would get, so cloud keys match
+            extension = video.get("format", "mp4").lower()
+            if not extension.startswith("."):
+                extension = f".{extension}"
+            filename = f"{source}_{video_id}{extension}"
+            
+            self.logger.info(f"Streaming video {video_id} from {source} to cloud storage")
+            success, url_or_error = self.scrapers[source].stream_to_cloud(
+                video.get("url", ""), self.cloud_uploader, filename, video
+            )
+            
+            if not success:
+                result["error"] = f"Failed to stream: {url_or_error}"
+                return result
+            
+            result["success"] = True
+            result["cloud_url"] = url_or_error or ""
+            return result
+            
+        except Exception as e:
+            self.logger.error(f"Error streaming video: {str(e)}")
+            result["error"] = str(e)
+            return result
+    
     def _download_video(self, video: Dict[str, Any]) -> Dict[str, Any]:
         """
         Download a video.
@@ -774,6 +873,7 @@ class EnhancedBatchProcessor:
         self.logger.info("Cleaning up resources")
         self.stop_batch()
         self._cleanup_temp_files()
+        self.close()
     
     def get_status(self) -> Dict[str, Any]:
         """
@@ -792,5 +892,7 @@ class EnhancedBatchProcessor:
             "total_videos_failed": self.total_videos_failed,
             "total_video_seconds": self.total_video_seconds,
             "total_video_hours": self.total_video_seconds / 3600,
+            "total_videos_streamed": self.total_videos_streamed,
+            "total_streamed_seconds": self.total_streamed_seconds,
             "scraper_status": scraper_status
         }
@@ -0,0 +1,132 @@
+"""
+Debounced, atomic persistence of batch processing state.
+"""
+
+import os
+import time
+import atexit
+import weakref
+import functools
+import threading
+from typing import Any, Dict
+import orjson
+
+
+def _close_at_exit(ref: "weakref.ref"):
+    """Flush a processor's pending state at interpreter exit, if it is still alive."""
+    owner = ref()
+    if owner is not None:
+        owner.close()
+
+
+class DebouncedStateMixin:
+    """
+    Write ``self.state`` to ``self.state_file`` at most once per flush interval.
+
+    Classes using the mixin set ``state``, ``state_file`` and ``logger``, call
+    _init_state_persistence from __init__, and call _save_state whenever the
+    state changes. close() (or leaving a ``with`` block) writes any pending
+    state; a processor that is never closed is flushed at interpreter exit.
+    """
+
+    def _init_state_persistence(self, config: Dict[str, Any]):
+        """
+        Set up the debounce timer and locks.
+
+        Args:
+            config: Processor configuration; reads state_flush_interval
+        """
+        # Saves made while a batch runs are coalesced into one write per interval
+        self.state_flush_interval = config.get("state_flush_interval", 5)  # seconds
+        self._state_lock = threading.Lock()
+        self._state_write_lock = threading.Lock()
+        self._state_dirty = False
+        self._state_flush_timer = None
+        self._last_state_flush = 0.0
+        self._state_version = 0
+        self._written_state_version = 0
+
+        # Held through a weak reference, so registering does not keep the processor alive
+        self._close_at_exit = functools.partial(_close_at_exit, weakref.ref(self))
+        atexit.register(self._close_at_exit)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _state_snapshot(self) -> Any:
+        """
+        Return the object to write to the state file.
+
+        Called with the state lock held; override to add or convert fields.
+        """
+        self.state["last_updated"] = time.time()
+        return self.state
+
+    def _save_state(self, force: bool = False):
+        """
+        Save batch processing state to file.
+
+        The file is written at most once per state_flush_interval; a save that
+        comes sooner is left to a timer that writes the latest state later.
+
+        Args:
+            force: Write immediately, e.g. when a batch finishes
+        """
+        with self._state_lock:
+            self._state_dirty = True
+            wait = self._last_state_flush + self.state_flush_interval - time.time()
+            if not force and wait > 0:
+                if self._state_flush_timer is None:
+                    self._state_flush_timer = threading.Timer(wait, self._flush_state)
+                    self._state_flush_timer.daemon = True
+                    self._state_flush_timer.start()
+                return
+
+        self._flush_state()
+
+    def close(self):
+        """Cancel any pending state write and flush the latest state to file."""
+        self._flush_state()
+        atexit.unregister(self._close_at_exit)
+
+    def _flush_state(self):
+        """Write batch processing state to file if it changed since the last write."""
+        # Serialize under the lock so the snapshot is consistent; write the file outside it
+        with self._state_lock:
+            if self._state_flush_timer is not None:
+                self._state_flush_timer.cancel()
+                self._state_flush_timer = None
+            if not self._state_dirty:
+                return
+
+            try:
+                data = orjson.dumps(self._state_snapshot(), option=orjson.OPT_NON_STR_KEYS)
+            except Exception as e:
+                self.logger.warning(f"Error saving batch state: {str(e)}")
+                return
+
+            self._state_dirty = False
+            self._last_state_flush = time.time()
+            self._state_version += 1
+            version = self._state_version
+
+        with self._state_write_lock:
+            # A newer snapshot may have been written while this one waited
+            if version < self._written_state_version:
+                return
+
+            try:
+                # Write to a temp file and swap it in, so a crash never leaves half a state file
+                tmp_file = self.state_file + ".tmp"
+                with open(tmp_file, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_file, self.state_file)
+                self._written_state_version = version
+
+            except Exception as e:
+                self.logger.warning(f"Error saving batch state: {str(e)}")
+                with self._state_lock:
+                    self._state_dirty = True
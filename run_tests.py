@@ -8,6 +8,7 @@ This script provides a unified way to run all tests or specific test categories.
 import os
 import sys
 import argparse
+import importlib.util
 import unittest
 import pytest
 import logging
@@ -58,13 +59,14 @@ def run_unittest_tests(test_pattern=None, verbose=False):
     return result.wasSuccessful()
 
 
-def run_pytest_tests(test_pattern=None, verbose=False):
+def run_pytest_tests(test_pattern=None, verbose=False, workers=None):
     """
     Run tests using pytest.
     
     Args:
         test_pattern: Optional pattern to filter tests
         verbose: Whether to show verbose output
+        workers: Number of pytest-xdist worker processes, or "auto"
     
     Returns:
         True if all tests pass, False otherwise
@@ -77,6 +79,13 @@ def run_pytest_tests(test_pattern=None, verbose=False):
     if verbose:
         pytest_args.append('-v')
     
+    if workers:
+        if importlib.util.find_spec('xdist'):
+            # Keep each test file on one worker so its class-level setup runs once
+            pytest_args.extend(['-n', str(workers), '--dist', 'loadfile'])
+        else:
+            logger.warning("pytest-xdist is not installed, running tests serially")
+    
     if test_pattern:
         pytest_args.append(test_pattern)
     else:
@@ -168,6 +177,9 @@ def main():
     parser.add_argument('--verbose', '-v', action='store_true', 
                       help='Show verbose output')
     
+    parser.add_argument('--workers', '-n', 
+                      help='Run pytest tests in parallel with pytest-xdist (a number or "auto")')
+    
     # Parse arguments
     args = parser.parse_args()
     
@@ -181,12 +193,12 @@ def main():
         if args.framework == 'unittest':
             success = run_unittest_tests(args.pattern, args.verbose)
         else:
-            success = run_pytest_tests(args.pattern, args.verbose)
+            success = run_pytest_tests(args.pattern, args.verbose, args.workers)
     else:
         if args.framework == 'unittest':
             success = run_unittest_tests(verbose=args.verbose)
         else:
-            success = run_pytest_tests(verbose=args.verbose)
+            success = run_pytest_tests(verbose=args.verbose, workers=args.workers)
     
     # Exit with appropriate status code
     sys.exit(0 if success else 1)
@@ -3,10 +3,13 @@ Base scraper module for video collection pipeline.
 """
 
 import os
+import re
 import time
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Generator, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Generator, Optional, Tuple
 import requests
 from bs4 import BeautifulSoup
 from selenium import webdriver
@@ -23,6 +26,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Splits comma-separated tag strings, folding the whitespace strip into the split
+_TAG_SPLIT = re.compile(r"\s*,\s*")
+
 class BaseScraper(ABC):
     """Base class for all video scrapers."""
     
@@ -36,6 +42,8 @@ class BaseScraper(ABC):
         self.config = config
         self.name = "base"
         self.session = requests.Session()
+        self.max_concurrent = config.get("max_concurrent", 5)  # Pages in flight for search_pages
+        self.max_download_workers = config.get("max_download_workers", 8)  # Threads for download_videos_batch
         self.logger = logging.getLogger(f"scraper.{self.name}")
         self.logger.info(f"Initializing {self.name} scraper")
         
@@ -104,6 +112,160 @@ class BaseScraper(ABC):
                 self.logger.error(f"Error paginating {self.name}: {str(e)}")
                 break
     
+    def download_videos_batch(self, urls_and_paths: List[Tuple[str, str]]) -> List[bool]:
+        """
+        Download several videos in parallel.
+        
+        Downloads spend most of their time waiting on the socket, so running
+        ``download_video`` on a thread pool overlaps the transfers.
+        
+        Args:
+            urls_and_paths: List of (video_url, output_path) pairs
+            
+        Returns:
+            List of download results, in the same order as ``urls_and_paths``
+        """
+        if not urls_and_paths:
+            return []
+        
+        workers = min(self.max_download_workers, len(urls_and_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda item: self.download_video(*item), urls_and_paths))
+    
+    @staticmethod
+    def _split_tags(tags: str) -> List[str]:
+        """
+        Split a comma-separated tag string into stripped, non-empty tags.
+        
+        Args:
+            tags: Comma-separated tags, e.g. "nature, forest,,river"
+            
+        Returns:
+            List of tags
+        """
+        return [tag for tag in _TAG_SPLIT.split(tags.strip()) if tag]
+    
+    def _is_downloaded(self, output_path: str) -> bool:
+        """
+        Check whether a previous run already completed this download.
+        
+        Downloads are only ever renamed into place once complete, so a
+        non-empty file at ``output_path`` is a finished download.
+        
+        Args:
+            output_path: Path where the video should be saved
+            
+        Returns:
+            True if the file exists and is non-empty, False otherwise
+        """
+        return os.path.exists(output_path) and os.path.getsize(output_path) > 0
+    
+    def _download_file(self, video_url: str, output_path: str, timeout: int = 30) -> bool:
+        """
+        Stream a URL to disk atomically.
+        
+        Data is written to ``output_path + ".part"``, flushed and fsynced, and
+        only then renamed over ``output_path``, so a killed process never
+        leaves a truncated file that looks complete. A ``.part`` file left by
+        an interrupted run is resumed with an HTTP Range request; servers that
+        ignore the range answer 200 and the download restarts from zero.
+        
+        Args:
+            video_url: URL of the video to download
+            output_path: Path where the video should be saved
+            timeout: Request timeout in seconds
+            
+        Returns:
+            True if download was successful, False otherwise
+        """
+        temp_path = output_path + ".part"
+        resume_from = os.path.getsize(temp_path) if os.path.exists(temp_path) else 0
+        headers = {"Range": f"bytes={resume_from}-"} if resume_from else None
+        
+        response = self.session.get(video_url, headers=headers, stream=True, timeout=timeout)
+        
+        if resume_from and response.status_code == 416:
+            # The partial file does not fit the remote one any more; start over
+            self.logger.warning(f"Cannot resume {temp_path}, restarting download")
+            response.close()
+            os.remove(temp_path)
+            resume_from = 0
+            response = self.session.get(video_url, stream=True, timeout=timeout)
+        
+        if resume_from and response.status_code == 206:
+            self.logger.info(f"Resuming download at byte {resume_from}")
+            mode = "ab"
+        elif response.status_code == 200:
+            mode = "wb"
+        else:
+            self.logger.error(f"Failed to download video: HTTP {response.status_code}")
+            return False
+        
+        with open(temp_path, mode) as f:
+            for chunk in response.iter_content(chunk_size=8192):
+                if chunk:
+                    f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        
+        # Never promote an empty download
+        if os.path.getsize(temp_path) == 0:
+            self.logger.error("Downloaded file is empty")
+            os.remove(temp_path)
+            return False
+        
+        os.replace(temp_path, output_path)
+        return True
+    
+    def search_pages(self, query: str, pages: List[int]) -> List[List[Dict[str, Any]]]:
+        """
+        Search several result pages concurrently.
+        
+        At most ``max_concurrent`` pages are in flight at once; each page still
+        goes through the scraper's own rate limiting, so the request rate is
+        unchanged while the round-trips overlap.
+        
+        Args:
+            query: Search term
+            pages: Page numbers to retrieve
+            
+        Returns:
+            List of result lists, in the same order as ``pages``
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.search_pages_async(query, pages))
+        
+        # asyncio.run can't nest inside a running loop; async callers should await search_pages_async
+        with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
+            return list(executor.map(lambda page: self.search_videos(query, page), pages))
+    
+    async def search_pages_async(self, query: str, pages: List[int]) -> List[List[Dict[str, Any]]]:
+        """
+        Search several result pages concurrently from a running event loop.
+        
+        Pages are fetched on worker threads, at most ``max_concurrent`` at a time.
+        
+        Args:
+            query: Search term
+            pages: Page numbers to retrieve
+            
+        Returns:
+            List of result lists, in the same order as ``pages``
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        
+        async def search_page(page: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await asyncio.to_thread(self.search_videos, query, page)
+        
+        return await asyncio.gather(*(search_page(page) for page in pages))
+    
+    def close(self):
+        """Close the HTTP session and release its pooled connections."""
+        self.session.close()
+    
     def _make_request(self, url: str, headers: Optional[Dict[str, str]] = None, 
                      params: Optional[Dict[str, Any]] = None) -> Optional[requests.Response]:
         """
@@ -7,8 +7,8 @@ This module provides functionality to search and download videos from Pixabay.
 import os
 import time
 import logging
-import requests
 import shutil
+import threading
 from typing import Dict, Any, List, Optional
 import json
 
@@ -36,11 +36,26 @@ class PixabayScraper(BaseScraper):
         self.base_url = config.get("base_url", "https://pixabay.com/api/videos/")
         self.per_page = config.get("per_page", 20)
         self.request_delay = config.get("request_delay", 1.0)  # Delay between requests to respect rate limits
+        self.last_request_time = float("-inf")  # monotonic clock; no request made yet
+        self._rate_limit_lock = threading.Lock()
         
         # Validate API key
         if not self.api_key:
             self.logger.warning("Pixabay API key not found in environment variables")
     
+    def _rate_limit(self):
+        """Space out request starts so concurrent page fetches share one rate limit."""
+        with self._rate_limit_lock:
+            current_time = time.monotonic()
+            time_since_last_request = current_time - self.last_request_time
+            
+            if time_since_last_request < self.request_delay:
+                sleep_time = self.request_delay - time_since_last_request
+                self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+                time.sleep(sleep_time)
+                
+            self.last_request_time = time.monotonic()
+    
     def search_videos(self, query: str, page: int = 1) -> List[Dict[str, Any]]:
         """
         Search for videos on Pixabay.
@@ -70,6 +85,7 @@ class PixabayScraper(BaseScraper):
             
             # Make request to Pixabay API
             self.logger.info(f"Searching Pixabay for '{query}', page {page}")
+            self._rate_limit()
             response = self._make_request(self.base_url, params=params)
             
             if not response:
@@ -83,41 +99,12 @@ class PixabayScraper(BaseScraper):
                 self.logger.error(f"Pixabay API error: {data['error']}")
                 return []
             
-            # Extract video information
-            videos = []
-            for hit in data.get("hits", []):
-                # Get the best quality video available
-                video_files = hit.get("videos", {})
-                best_video = self._get_best_quality_video(video_files)
-                
-                if not best_video:
-                    continue
-                
-                # Create video metadata
-                video_metadata = {
-                    "id": str(hit.get("id", "")),
-                    "source": self.name,
-                    "title": hit.get("tags", "").replace(",", " ").strip(),
-                    "description": f"Video by {hit.get('user', '')} on Pixabay",
-                    "url": best_video.get("url", ""),
-                    "thumbnail": hit.get("userImageURL", ""),
-                    "width": best_video.get("width", 0),
-                    "height": best_video.get("height", 0),
-                    "duration": hit.get("duration", 0),
-                    "format": "mp4",
-                    "user": hit.get("user", ""),
-                    "tags": hit.get("tags", "").split(","),
-                    "page_url": hit.get("pageURL", ""),
-                    "license": "Pixabay License",
-                    "ai_generated": False  # Pixabay doesn't explicitly mark AI-generated content
-                }
-                
-                videos.append(video_metadata)
-            
-            # Add delay to respect rate limits
-            time.sleep(self.request_delay)
-            
-            return videos
+            # Extract video information, skipping hits without a usable video file
+            return [
+                self._build_metadata(hit, best_video)
+                for hit in data.get("hits", [])
+                if (best_video := self._get_best_quality_video(hit.get("videos", {})))
+            ]
             
         except Exception as e:
             self.logger.error(f"Error searching Pixabay: {str(e)}")
@@ -140,6 +127,36 @@ class PixabayScraper(BaseScraper):
         
         return {}
     
+    def _build_metadata(self, hit: Dict[str, Any], best_video: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a Pixabay hit to the standard metadata format.
+        
+        Args:
+            hit: A single entry from the API's ``hits`` list
+            best_video: The video file chosen by ``_get_best_quality_video``
+            
+        Returns:
+            Video metadata dictionary
+        """
+        tags = hit.get("tags", "")
+        return {
+            "id": str(hit.get("id", "")),
+            "source": self.name,
+            "title": tags.replace(",", " ").strip(),
+            "description": f"Video by {hit.get('user', '')} on Pixabay",
+            "url": best_video.get("url", ""),
+            "thumbnail": hit.get("userImageURL", ""),
+            "width": best_video.get("width", 0),
+            "height": best_video.get("height", 0),
+            "duration": hit.get("duration", 0),
+            "format": "mp4",
+            "user": hit.get("user", ""),
+            "tags": self._split_tags(tags),
+            "page_url": hit.get("pageURL", ""),
+            "license": "Pixabay License",
+            "ai_generated": False  # Pixabay doesn't explicitly mark AI-generated content
+        }
+    
     def get_video_metadata(self, video_id: str) -> Dict[str, Any]:
         """
         Get metadata for a specific video.
@@ -163,6 +180,7 @@ class PixabayScraper(BaseScraper):
             
             # Make request to Pixabay API
             self.logger.info(f"Getting metadata for Pixabay video {video_id}")
+            self._rate_limit()
             response = self._make_request(self.base_url, params=params)
             
             if not response:
@@ -190,29 +208,7 @@ class PixabayScraper(BaseScraper):
                 self.logger.warning(f"No video formats found for ID {video_id}")
                 return {}
             
-            # Build metadata
-            video_metadata = {
-                "id": str(hit.get("id", "")),
-                "source": self.name,
-                "title": hit.get("tags", "").replace(",", " ").strip(),
-                "description": f"Video by {hit.get('user', '')} on Pixabay",
-                "url": best_video.get("url", ""),
-                "thumbnail": hit.get("userImageURL", ""),
-                "width": best_video.get("width", 0),
-                "height": best_video.get("height", 0),
-                "duration": hit.get("duration", 0),
-                "format": "mp4",
-                "user": hit.get("user", ""),
-                "tags": hit.get("tags", "").split(","),
-                "page_url": hit.get("pageURL", ""),
-                "license": "Pixabay License",
-                "ai_generated": False
-            }
-            
-            # Add delay to respect rate limits
-            time.sleep(self.request_delay)
-            
-            return video_metadata
+            return self._build_metadata(hit, best_video)
             
         except Exception as e:
             self.logger.error(f"Error getting Pixabay video metadata: {str(e)}")
@@ -230,6 +226,11 @@ class PixabayScraper(BaseScraper):
             True if download was successful, False otherwise
         """
         try:
+            # Skip videos completed by a previous run
+            if self._is_downloaded(output_path):
+                self.logger.info(f"Video already downloaded to {output_path}")
+                return True
+            
             self.logger.info(f"Downloading Pixabay video from {video_url}")
             
             # If the "URL" is actually a local file path, just copy it
@@ -239,20 +240,7 @@ class PixabayScraper(BaseScraper):
                 return True
             
             # Otherwise, fetch over HTTP
-            response = requests.get(video_url, stream=True, timeout=30)
-            if response.status_code != 200:
-                self.logger.error(f"Failed to download video: HTTP {response.status_code}")
-                return False
-            
-            # Save video to output path
-            with open(output_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-            
-            # Verify file was downloaded
-            if not os.path.exists(output_path) or os.path.getsize(output_path) == 0:
-                self.logger.error("Downloaded file is empty or does not exist")
+            if not self._download_file(video_url, output_path):
                 return False
             
             self.logger.info(f"Successfully downloaded video to {output_path}")
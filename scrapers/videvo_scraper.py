@@ -5,8 +5,8 @@ Videvo API scraper implementation for video collection pipeline.
 import os
 import logging
 import time
+import threading
 from typing import List, Dict, Any, Optional
-import requests
 from urllib.parse import urlencode
 from scrapers.base_scraper import BaseScraper
 
@@ -47,19 +47,21 @@ class VidevoScraper(BaseScraper):
         
         # Rate limiting settings
         self.request_delay = config.get("request_delay", 1.0)  # seconds between requests
-        self.last_request_time = 0
+        self.last_request_time = float("-inf")  # monotonic clock; no request made yet
+        self._rate_limit_lock = threading.Lock()
     
     def _rate_limit(self):
         """Apply rate limiting to avoid overloading the API."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        
-        if time_since_last_request < self.request_delay:
-            sleep_time = self.request_delay - time_since_last_request
-            self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
+        with self._rate_limit_lock:
+            current_time = time.monotonic()
+            time_since_last_request = current_time - self.last_request_time
             
-        self.last_request_time = time.time()
+            if time_since_last_request < self.request_delay:
+                sleep_time = self.request_delay - time_since_last_request
+                self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+                time.sleep(sleep_time)
+                
+            self.last_request_time = time.monotonic()
     
     def search_videos(self, query: str, page: int = 1) -> List[Dict[str, Any]]:
         """
@@ -96,39 +98,9 @@ class VidevoScraper(BaseScraper):
                 self.logger.warning(f"No videos found for query '{query}' on page {page}")
                 return []
             
-            # Transform the API response to our standard format
-            results = []
-            for video in videos_dict["results"]:
-                source = video.get("_source", {})
-                
-                # Skip premium videos
-                if source.get("is_premium", 0) == 1:
-                    continue
-                
-                # Create standardized metadata
-                metadata = {
-                    "id": str(source.get("id", "")),
-                    "source": "videvo",
-                    "title": source.get("title", ""),
-                    "url": source.get("small_preview_mp4", ""),  # Preview URL, will need to get full URL later
-                    "thumbnail": source.get("thumbnail", ""),
-                    "duration": self._parse_duration(source.get("duration", "00:00")),
-                    "width": self._parse_resolution(source.get("frame", "0x0"))[0],
-                    "height": self._parse_resolution(source.get("frame", "0x0"))[1],
-                    "format": source.get("codec", "mp4"),
-                    "user": source.get("author", "Unknown"),
-                    "license": source.get("license", "Unknown"),
-                    "original_url": source.get("details_page", ""),
-                    "description": source.get("description", ""),
-                    "tags": [tag.strip() for tag in source.get("keywords", "").split(",") if tag.strip()],
-                    "date_published": source.get("date_published", ""),
-                    "is_editorial": source.get("is_editorial", 0) == 1,
-                    "is_sensitive": source.get("is_sensitive", False)
-                }
-                
-                results.append(metadata)
-            
-            return results
+            # Transform the API response to our standard format, skipping premium videos
+            sources = (video.get("_source", {}) for video in videos_dict["results"])
+            return [self._build_metadata(source) for source in sources if source.get("is_premium", 0) != 1]
             
         except Exception as e:
             self.logger.error(f"Error searching Videvo: {str(e)}")
@@ -173,33 +145,43 @@ class VidevoScraper(BaseScraper):
                 self.logger.warning(f"Video {video_id} is premium, skipping")
                 return {}
             
-            # Create standardized metadata
-            metadata = {
-                "id": str(source.get("id", "")),
-                "source": "videvo",
-                "title": source.get("title", ""),
-                "url": source.get("small_preview_mp4", ""),  # Preview URL, will need to get full URL later
-                "thumbnail": source.get("thumbnail", ""),
-                "duration": self._parse_duration(source.get("duration", "00:00")),
-                "width": self._parse_resolution(source.get("frame", "0x0"))[0],
-                "height": self._parse_resolution(source.get("frame", "0x0"))[1],
-                "format": source.get("codec", "mp4"),
-                "user": source.get("author", "Unknown"),
-                "license": source.get("license", "Unknown"),
-                "original_url": source.get("details_page", ""),
-                "description": source.get("description", ""),
-                "tags": [tag.strip() for tag in source.get("keywords", "").split(",") if tag.strip()],
-                "date_published": source.get("date_published", ""),
-                "is_editorial": source.get("is_editorial", 0) == 1,
-                "is_sensitive": source.get("is_sensitive", False)
-            }
-            
-            return metadata
+            return self._build_metadata(source)
             
         except Exception as e:
             self.logger.error(f"Error getting Videvo metadata: {str(e)}")
             return {}
     
+    def _build_metadata(self, source: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a Videvo ``_source`` record to the standard metadata format.
+        
+        Args:
+            source: The ``_source`` object of a Videvo API result
+            
+        Returns:
+            Video metadata dictionary
+        """
+        width, height = self._parse_resolution(source.get("frame", "0x0"))
+        return {
+            "id": str(source.get("id", "")),
+            "source": "videvo",
+            "title": source.get("title", ""),
+            "url": source.get("small_preview_mp4", ""),  # Preview URL, will need to get full URL later
+            "thumbnail": source.get("thumbnail", ""),
+            "duration": self._parse_duration(source.get("duration", "00:00")),
+            "width": width,
+            "height": height,
+            "format": source.get("codec", "mp4"),
+            "user": source.get("author", "Unknown"),
+            "license": source.get("license", "Unknown"),
+            "original_url": source.get("details_page", ""),
+            "description": source.get("description", ""),
+            "tags": self._split_tags(source.get("keywords", "")),
+            "date_published": source.get("date_published", ""),
+            "is_editorial": source.get("is_editorial", 0) == 1,
+            "is_sensitive": source.get("is_sensitive", False)
+        }
+    
     def download_video(self, video_url: str, output_path: str) -> bool:
         """
         Download video from URL to specified path.
@@ -212,6 +194,11 @@ class VidevoScraper(BaseScraper):
             True if download was successful, False otherwise
         """
         try:
+            # Skip videos completed by a previous run
+            if self._is_downloaded(output_path):
+                self.logger.info(f"Video already downloaded to {output_path}")
+                return True
+            
             self._rate_limit()
             
             # For Videvo, we need to extract the actual download URL from the details page
@@ -256,12 +243,8 @@ class VidevoScraper(BaseScraper):
                 video_url = download_link['href']
             
             # Now download the actual video
-            response = requests.get(video_url, stream=True, timeout=30)
-            response.raise_for_status()
-            
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            if not self._download_file(video_url, output_path):
+                return False
             
             self.logger.info(f"Successfully downloaded video to {output_path}")
             return True
@@ -3,18 +3,49 @@ Wikimedia Commons API scraper implementation for video collection pipeline.
 """
 
 import os
+import re
+import shutil
 import logging
 import time
 import json
-from typing import List, Dict, Any, Optional
+import threading
+from typing import List, Dict, Any, Optional, Tuple
+import orjson
 import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from scrapers.base_scraper import BaseScraper
 
+try:
+    import httpx  # Optional; only used when the "http2" setting is enabled
+except ImportError:
+    httpx = None
+
 logger = logging.getLogger(__name__)
 
+# Splits pipe-separated category strings, folding the whitespace strip into the split
+_CAT_SPLIT = re.compile(r"\s*\|\s*")
+
+
+def _parse_categories(value: Any) -> List[str]:
+    """Split an extmetadata Categories value into category names."""
+    if not isinstance(value, str):
+        return []
+    return [cat for cat in _CAT_SPLIT.split(value.strip()) if cat]
+
+
 class WikimediaScraper(BaseScraper):
     """Scraper for Wikimedia Commons video content."""
     
+    # extmetadata entries copied into file metadata: (extmetadata key, metadata key,
+    # parser applied to the entry's "value", which is None when the entry is missing)
+    _EXT_FIELDS = (
+        ("License", "license", lambda value: "Unknown" if value is None else value),
+        ("ImageDescription", "description", lambda value: "" if value is None else value),
+        ("Categories", "categories", _parse_categories),
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the Wikimedia Commons scraper with configuration.
@@ -31,30 +62,164 @@ class WikimediaScraper(BaseScraper):
         self.core_rest_url = config.get("core_rest_url", "https://api.wikimedia.org/core/v1/commons/file")
         
         self.per_page = config.get("per_page", 50)
+        self.min_resolution = config.get("min_resolution", 512)  # pixels, both width and height
         
         # Set up headers for API access
         self.headers = {
             "User-Agent": "AfterQuery Video Collection Pipeline/1.0 (contact@example.com)"
         }
-        # Use a persistent session with compliant User-Agent for downloads
-        self.session = requests.Session()
+        # Share one pooled session (created by BaseScraper) across API and download
+        # calls so TLS connections to commons.wikimedia.org are reused
+        retry = Retry(
+            total=config.get("max_retries", 3),
+            backoff_factor=config.get("retry_backoff", 0.5),
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False  # Hand the final error response back so the delay can adapt
+        )
+        adapter = HTTPAdapter(
+            pool_connections=config.get("pool_connections", 10),
+            pool_maxsize=config.get("pool_maxsize", 50),
+            max_retries=retry
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.session.headers.update(self.headers)
+        self.session.hooks["response"].append(self._adapt_rate)
+        
+        # Adaptive rate limiting: the delay starts at request_delay, shrinks while
+        # the API answers normally and doubles on 429/5xx (AIMD)
+        self.request_delay = config.get("request_delay", 1.0)  # initial seconds between requests
+        self.min_delay = config.get("min_delay", 0.1)
+        self.max_delay = config.get("max_delay", 60.0)
+        self._current_delay = self.request_delay
+        self._delay_lock = threading.Lock()
+        self.last_request_time = float("-inf")  # monotonic clock; no request made yet
+        self._rate_limit_lock = threading.Lock()
+        
+        # File metadata cache; empty results are kept briefly so missing files aren't re-queried
+        self._meta_cache = TTLCache(
+            maxsize=config.get("metadata_cache_size", 4096),
+            ttl=config.get("metadata_cache_ttl", 3600)  # seconds
+        )
+        self._negative_cache = TTLCache(
+            maxsize=config.get("metadata_cache_size", 4096),
+            ttl=config.get("metadata_negative_ttl", 60)  # seconds
+        )
+        self._cache_lock = threading.Lock()
+        
+        # Optional HTTP/2 client for API calls, so concurrent imageinfo requests
+        # share one multiplexed connection; downloads stay on the requests session
+        self._http2_client = self._create_http2_client() if config.get("http2", False) else None
+    
+    def _create_http2_client(self):
+        """
+        Create an HTTP/2 client for API requests.
+        
+        Returns:
+            httpx.Client, or None if httpx (with h2) is not installed
+        """
+        if httpx is None:
+            self.logger.warning("http2 is enabled but httpx is not installed; using HTTP/1.1")
+            return None
         
-        # Rate limiting settings
-        self.request_delay = config.get("request_delay", 1.0)  # seconds between requests
-        self.last_request_time = 0
+        try:
+            return httpx.Client(
+                http2=True,
+                headers=self.headers,
+                timeout=10,
+                limits=httpx.Limits(
+                    max_connections=self.config.get("pool_maxsize", 50),
+                    max_keepalive_connections=self.config.get("pool_maxsize", 50)
+                ),
+                event_hooks={"response": [self._adapt_rate]}
+            )
+        except ImportError as e:
+            self.logger.warning(f"http2 is enabled but unavailable ({str(e)}); using HTTP/1.1")
+            return None
+    
+    def _make_request(self, url: str, headers: Optional[Dict[str, str]] = None,
+                      params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """
+        Make an API request, over HTTP/2 when the client is available.
+        
+        Args:
+            url: URL to request
+            headers: Optional HTTP headers
+            params: Optional query parameters
+            
+        Returns:
+            Response object or None if request failed
+        """
+        if self._http2_client is None:
+            return super()._make_request(url, headers=headers, params=params)
+        
+        try:
+            response = self._http2_client.get(url, headers=headers, params=params)
+            response.raise_for_status()
+            return response
+        except Exception as e:
+            self.logger.error(f"Request error: {str(e)}")
+            return None
+    
+    def close(self):
+        """Close the HTTP session and the HTTP/2 client, if any."""
+        super().close()
+        if self._http2_client is not None:
+            self._http2_client.close()
     
     def _rate_limit(self):
         """Apply rate limiting to avoid overloading the API."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        with self._rate_limit_lock:
+            current_time = time.monotonic()
+            time_since_last_request = current_time - self.last_request_time
+            
+            if time_since_last_request < self._current_delay:
+                sleep_time = self._current_delay - time_since_last_request
+                self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+                time.sleep(sleep_time)
+                
+            self.last_request_time = time.monotonic()
+    
+    def _adapt_rate(self, response: requests.Response, *args, **kwargs) -> requests.Response:
+        """
+        Session response hook that adjusts the delay between requests.
+        
+        Successful responses shrink the delay by 10% down to ``min_delay``;
+        429 and 5xx responses double it up to ``max_delay``, waiting at least
+        as long as the server's Retry-After asks.
+        
+        Args:
+            response: Response received by the session
+            
+        Returns:
+            The response, unchanged
+        """
+        with self._delay_lock:
+            if response.status_code == 429 or response.status_code >= 500:
+                try:
+                    retry_after = float(response.headers.get("Retry-After", 0))
+                except (TypeError, ValueError):
+                    retry_after = 0  # HTTP-date form; fall back to plain doubling
+                self._current_delay = min(self.max_delay, max(self._current_delay * 2, retry_after))
+                self.logger.debug(f"Backing off: delay now {self._current_delay:.2f} seconds")
+            elif response.status_code < 400:
+                self._current_delay = max(self.min_delay, self._current_delay * 0.9)
+        return response
+    
+    def _parse_json(self, response: requests.Response) -> Any:
+        """
+        Decode a JSON API response with orjson.
+        
+        imageinfo/extmetadata payloads are large, and orjson decodes them
+        several times faster than the stdlib parser behind ``response.json()``.
         
-        if time_since_last_request < self.request_delay:
-            sleep_time = self.request_delay - time_since_last_request
-            self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
+        Args:
+            response: API response
             
-        self.last_request_time = time.time()
+        Returns:
+            Decoded JSON data
+        """
+        return orjson.loads(response.content)
     
     def search_videos(self, query: str, page: int = 1) -> List[Dict[str, Any]]:
         """
@@ -73,15 +238,19 @@ class WikimediaScraper(BaseScraper):
             # Calculate offset for pagination
             offset = (page - 1) * self.per_page
             
-            # Prepare API parameters for search
+            # Search the File namespace and fetch imageinfo for the hits in the same request;
+            # filew/fileh let the search backend drop files below the minimum resolution
             params = {
                 "action": "query",
                 "format": "json",
-                "list": "search",
-                "srsearch": f"{query} filetype:video",
-                "srnamespace": "6",  # File namespace
-                "srlimit": self.per_page,
-                "sroffset": offset
+                "generator": "search",
+                "gsrsearch": f"{query} filetype:video filew:>{self.min_resolution - 1} fileh:>{self.min_resolution - 1}",
+                "gsrnamespace": "6",  # File namespace
+                "gsrlimit": self.per_page,
+                "gsroffset": offset,
+                "prop": "imageinfo",
+                "iiprop": "url|size|mime|metadata|extmetadata|timestamp|user",
+                "iiurlwidth": 800  # For thumbnail
             }
             
             response = self._make_request(self.search_url, headers=self.headers, params=params)
@@ -89,30 +258,37 @@ class WikimediaScraper(BaseScraper):
                 self.logger.warning(f"No response from Wikimedia API for query '{query}' on page {page}")
                 return []
             
-            data = response.json()
+            data = self._parse_json(response)
             
-            if not data or "query" not in data or "search" not in data["query"]:
+            if not data or "query" not in data or "pages" not in data["query"]:
                 self.logger.warning(f"No videos found for query '{query}' on page {page}")
                 return []
             
+            # Generator results are keyed by page id; "index" preserves the search ranking
+            pages = sorted(data["query"]["pages"].values(), key=lambda page_data: page_data.get("index", 0))
+            
             # Transform the API response to our standard format
             results = []
-            for item in data["query"]["search"]:
-                title = item.get("title", "")
-                if not title.startswith("File:"):
+            for page_data in pages:
+                title = page_data.get("title", "")
+                if not title.startswith("File:") or not page_data.get("imageinfo"):
+                    continue
+                
+                # Skip low resolutions before parsing the full metadata
+                image_info = page_data["imageinfo"][0]
+                if image_info.get("width", 0) < self.min_resolution or image_info.get("height", 0) < self.min_resolution:
                     continue
                 
                 # Extract file name from title
                 file_name = title.replace("File:", "")
                 
-                # Get detailed metadata for the file
-                file_metadata = self._get_file_metadata(file_name)
+                file_metadata = self._parse_image_info(image_info)
                 if not file_metadata:
                     continue
                 
-                # Skip if not a video or doesn't meet minimum resolution
-                if not file_metadata.get("is_video", False) or file_metadata.get("width", 0) < 512 or file_metadata.get("height", 0) < 512:
-                    continue
+                # Keep the metadata for later get_video_metadata calls
+                with self._cache_lock:
+                    self._meta_cache[file_name] = file_metadata
                 
                 # Create standardized metadata
                 metadata = {
@@ -128,7 +304,7 @@ class WikimediaScraper(BaseScraper):
                     "user": file_metadata.get("user", "Unknown"),
                     "license": file_metadata.get("license", "Unknown"),
                     "original_url": f"https://commons.wikimedia.org/wiki/File:{file_name}",
-                    "description": item.get("snippet", ""),
+                    "description": file_metadata.get("description", ""),
                     "tags": file_metadata.get("categories", []),
                     "date_created": file_metadata.get("timestamp", "")
                 }
@@ -145,13 +321,42 @@ class WikimediaScraper(BaseScraper):
     
     def _get_file_metadata(self, file_name: str) -> Dict[str, Any]:
         """
-        Get detailed metadata for a Wikimedia Commons file.
+        Get detailed metadata for a Wikimedia Commons file, using the TTL cache.
+        
+        Files found by search_videos are already cached, so only files looked
+        up directly by name cost an API call.
+        
+        Args:
+            file_name: Name of the file (without 'File:' prefix)
+            
+        Returns:
+            Dictionary with file metadata, or an empty dict if the file is not a video
+        """
+        with self._cache_lock:
+            if file_name in self._meta_cache:
+                return self._meta_cache[file_name]
+            if file_name in self._negative_cache:
+                return {}
+        
+        metadata = self._fetch_file_metadata(file_name)
+        
+        with self._cache_lock:
+            if metadata:
+                self._meta_cache[file_name] = metadata
+            else:
+                self._negative_cache[file_name] = True
+        
+        return metadata
+    
+    def _fetch_file_metadata(self, file_name: str) -> Dict[str, Any]:
+        """
+        Request metadata for a Wikimedia Commons file.
         
         Args:
             file_name: Name of the file (without 'File:' prefix)
             
         Returns:
-            Dictionary with file metadata
+            Dictionary with file metadata, or an empty dict if the file is missing or not a video
         """
         try:
             self._rate_limit()
@@ -171,86 +376,78 @@ class WikimediaScraper(BaseScraper):
                 self.logger.warning(f"No response for file metadata: {file_name}")
                 return {}
             
-            data = response.json()
+            data = self._parse_json(response)
             
             if not data or "query" not in data or "pages" not in data["query"]:
                 return {}
             
-            # Extract page data (there should be only one)
-            pages = data["query"]["pages"]
-            if not pages:
-                return {}
-            
-            page_id = next(iter(pages))
-            page_data = pages[page_id]
-            
-            if "imageinfo" not in page_data or not page_data["imageinfo"]:
-                return {}
-            
-            image_info = page_data["imageinfo"][0]
-            
-            # Check if it's a video
-            mime_type = image_info.get("mime", "")
-            is_video = mime_type.startswith("video/")
-            
-            if not is_video:
+            # A single title comes back as a single page, whatever the title was normalized to
+            page_data = next(iter(data["query"]["pages"].values()), {})
+            if not page_data.get("imageinfo"):
                 return {}
             
-            # Extract metadata
-            metadata = image_info.get("metadata", [])
-            ext_metadata = image_info.get("extmetadata", {})
-            
-            # Extract duration
-            duration = 0
-            for meta in metadata:
-                if isinstance(meta, dict) and meta.get("name") == "length":
-                    try:
-                        duration = float(meta.get("value", 0))
-                    except (ValueError, TypeError):
-                        pass
-                    break
-            
-            # Extract license
-            license_info = "Unknown"
-            if "License" in ext_metadata:
-                license_data = ext_metadata["License"]
-                license_info = license_data.get("value", "Unknown")
-            
-            # Extract categories
-            categories = []
-            if "Categories" in ext_metadata:
-                categories_data = ext_metadata["Categories"]
-                categories_str = categories_data.get("value", "")
-                if isinstance(categories_str, str):
-                    categories = [cat.strip() for cat in categories_str.split("|") if cat.strip()]
-            
-            # Get direct video URL
-            video_url = image_info.get("url", "")
-            
-            # Get thumbnail URL
-            thumbnail_url = image_info.get("thumburl", "")
-            
-            # Extract format from mime type
-            format_type = mime_type.split("/")[-1] if mime_type else ""
-            
-            return {
-                "url": video_url,
-                "thumbnail": thumbnail_url,
-                "duration": duration,
-                "width": image_info.get("width", 0),
-                "height": image_info.get("height", 0),
-                "format": format_type,
-                "user": image_info.get("user", "Unknown"),
-                "license": license_info,
-                "categories": categories,
-                "timestamp": image_info.get("timestamp", ""),
-                "is_video": is_video
-            }
+            return self._parse_image_info(page_data["imageinfo"][0])
             
         except Exception as e:
             self.logger.error(f"Error getting file metadata for {file_name}: {str(e)}")
             return {}
     
+    def _parse_image_info(self, image_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert an ``imageinfo`` entry to file metadata.
+        
+        Args:
+            image_info: First ``imageinfo`` entry of a page in the API response
+            
+        Returns:
+            Dictionary with file metadata, or an empty dict if the file is not a video
+        """
+        # Check if it's a video
+        mime_type = image_info.get("mime", "")
+        is_video = mime_type.startswith("video/")
+        
+        if not is_video:
+            return {}
+        
+        # Extract metadata, indexing the name/value list once
+        metadata = image_info.get("metadata") or []
+        meta_by_name = {meta["name"]: meta.get("value") for meta in metadata if isinstance(meta, dict) and "name" in meta}
+        ext_metadata = image_info.get("extmetadata", {})
+        
+        # Extract duration
+        try:
+            duration = float(meta_by_name.get("length", 0) or 0)
+        except (ValueError, TypeError):
+            duration = 0
+        
+        # Extract license, description and categories
+        ext_fields = {
+            key: parse(ext_metadata.get(ext_key, {}).get("value"))
+            for ext_key, key, parse in self._EXT_FIELDS
+        }
+        
+        # Get direct video URL
+        video_url = image_info.get("url", "")
+        
+        # Get thumbnail URL
+        thumbnail_url = image_info.get("thumburl", "")
+        
+        # Extract format from mime type
+        format_type = mime_type.split("/")[-1] if mime_type else ""
+        
+        return {
+            "url": video_url,
+            "thumbnail": thumbnail_url,
+            "duration": duration,
+            "width": image_info.get("width", 0),
+            "height": image_info.get("height", 0),
+            "format": format_type,
+            "user": image_info.get("user", "Unknown"),
+            "timestamp": image_info.get("timestamp", ""),
+            "is_video": is_video,
+            **ext_fields
+        }
+    
     def get_video_metadata(self, video_id: str) -> Dict[str, Any]:
         """
         Get detailed metadata for a specific video.
@@ -287,7 +484,7 @@ class WikimediaScraper(BaseScraper):
                 "user": file_metadata.get("user", "Unknown"),
                 "license": file_metadata.get("license", "Unknown"),
                 "original_url": f"https://commons.wikimedia.org/wiki/File:{video_id}",
-                "description": "",  # No description in this context
+                "description": file_metadata.get("description", ""),
                 "tags": file_metadata.get("categories", []),
                 "date_created": file_metadata.get("timestamp", "")
             }
@@ -298,6 +495,39 @@ class WikimediaScraper(BaseScraper):
             self.logger.error(f"Error getting Wikimedia metadata: {str(e)}")
             return {}
     
+    def stream_to_cloud(self, video_url: str, uploader: Any, filename: str,
+                        metadata: Optional[Dict[str, Any]] = None) -> Tuple[bool, Optional[str]]:
+        """
+        Pipe a video from Wikimedia Commons straight into cloud storage.
+        
+        The response body is handed to the uploader as a stream, so the bytes
+        never touch local disk. The batch processor takes this path when its
+        ``stream_to_cloud`` option is set; validation still requires ``download_video``.
+        
+        Args:
+            video_url: URL of the video to transfer
+            uploader: CloudStorageUploader to write to
+            filename: File name used to build the cloud key
+            metadata: Optional metadata to store with the video
+            
+        Returns:
+            Tuple of (success, public URL or error message)
+        """
+        try:
+            self._rate_limit()
+            
+            response = self.session.get(video_url, stream=True, timeout=60)
+            try:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                return uploader.upload_stream(response.raw, filename, metadata)
+            finally:
+                response.close()
+            
+        except Exception as e:
+            self.logger.error(f"Error streaming video to cloud storage: {str(e)}")
+            return False, str(e)
+    
     def download_video(self, video_url: str, output_path: str) -> bool:
         """
         Download video from URL to specified path.
@@ -310,15 +540,37 @@ class WikimediaScraper(BaseScraper):
             True if download was successful, False otherwise
         """
         try:
+            # Skip videos completed by a previous run
+            if self._is_downloaded(output_path):
+                self.logger.info(f"Video already downloaded to {output_path}")
+                return True
+            
             self._rate_limit()
             
             # For Wikimedia Commons, we can directly download the video from the URL
             response = self.session.get(video_url, stream=True, timeout=60)  # Use session with compliant User-Agent
-            response.raise_for_status()
-            
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            try:
+                response.raise_for_status()
+                
+                # Copy the raw stream in 1 MiB blocks into a .part file, renamed once complete
+                temp_path = output_path + ".part"
+                response.raw.decode_content = True
+                with open(temp_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+                    f.flush()
+                    os.fsync(f.fileno())
+            finally:
+                response.close()
+            
+            # Catch truncated transfers (the length only matches undecoded bodies)
+            expected_size = int(response.headers.get("Content-Length") or 0)
+            written_size = os.path.getsize(temp_path)
+            if expected_size and "Content-Encoding" not in response.headers and written_size != expected_size:
+                self.logger.error(f"Truncated download: got {written_size} of {expected_size} bytes")
+                os.remove(temp_path)
+                return False
+            
+            os.replace(temp_path, output_path)
             
             self.logger.info(f"Successfully downloaded video to {output_path}")
             return True
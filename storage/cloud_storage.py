@@ -6,14 +6,23 @@ import os
 import logging
 import json
 import time
-from typing import Dict, Any, List, Optional
+import shutil
+import hashlib
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Tuple
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
+from cachetools import LRUCache, TTLCache
 from google.cloud import storage
 from azure.storage.blob import BlobServiceClient
 
 logger = logging.getLogger(__name__)
 
+MB = 1024 * 1024
+
 class CloudStorageUploader:
     """Module for uploading validated videos to cloud storage."""
     
@@ -36,16 +45,42 @@ class CloudStorageUploader:
         if self.folder_prefix and not self.folder_prefix.endswith("/"):
             self.folder_prefix += "/"
         
+        # Large uploads are split into parts that are sent in parallel
+        self.multipart_threshold = config.get("multipart_threshold", 8 * MB)
+        self.multipart_chunksize = config.get("multipart_chunksize", 16 * MB)
+        self.max_concurrency = config.get("max_concurrency", 16)
+        self.transfer_config = None
+        
+        # Bucket/container handles, resolved once in _initialize_client
+        self._gcp_bucket = None
+        self._azure_container = None
+        
         # Initialize cloud client based on provider
         self.client = self._initialize_client()
         
-        # Track upload history
+        # Track upload history in SQLite so recording an upload is a single-row write.
+        # upload_history_file is the legacy JSON history, imported on first run.
         self.upload_history_file = config.get("upload_history_file", "upload_history.json")
-        self.upload_history = self._load_upload_history()
+        self.upload_history_db = config.get(
+            "upload_history_db",
+            os.path.splitext(self.upload_history_file)[0] + ".db"
+        )
+        self._history_lock = threading.Lock()
+        # (path, size, mtime_ns) -> content hash, bounded so long batch runs don't grow it forever
+        self._hash_cache = LRUCache(maxsize=config.get("hash_cache_size", 4096))
+        self._hash_cache_lock = threading.Lock()
+        self._history_conn = self._open_upload_history()
+        
+        # Remember head_object results for a while; objects can change outside this process
+        self._head_cache = TTLCache(maxsize=4096, ttl=config.get("head_cache_ttl", 300))
+        self._head_cache_lock = threading.Lock()
         
         # Configure retry settings
         self.max_retries = config.get("max_retries", 3)
         self.retry_delay = config.get("retry_delay", 2)  # seconds
+        
+        # Number of videos uploaded concurrently by upload_videos
+        self.upload_workers = config.get("upload_workers", 8)
     
     def _initialize_client(self):
         """
@@ -56,6 +91,14 @@ class CloudStorageUploader:
         """
         try:
             if self.provider == "aws":
+                # Multipart settings for S3 managed transfers
+                self.transfer_config = TransferConfig(
+                    multipart_threshold=self.multipart_threshold,
+                    multipart_chunksize=self.multipart_chunksize,
+                    max_concurrency=self.max_concurrency,
+                    use_threads=True
+                )
+                
                 # AWS S3 client
                 return boto3.client(
                     's3',
@@ -66,12 +109,16 @@ class CloudStorageUploader:
             
             elif self.provider == "gcp":
                 # Google Cloud Storage client
-                return storage.Client()
+                client = storage.Client()
+                self._gcp_bucket = client.bucket(self.bucket_name)
+                return client
             
             elif self.provider == "azure":
                 # Azure Blob Storage client
                 connection_string = os.getenv("AZURE_STORAGE_CONNECTION_STRING")
-                return BlobServiceClient.from_connection_string(connection_string)
+                client = BlobServiceClient.from_connection_string(connection_string)
+                self._azure_container = client.get_container_client(self.bucket_name)
+                return client
             
             elif self.provider == "local":
                 # Local storage does not require a client
@@ -99,14 +146,7 @@ class CloudStorageUploader:
         if self.provider == "local":
             try:
                 # Generate local storage path using same prefix logic as cloud
-                filename = os.path.basename(video_path)
-                # Strip any leading "downloads_" from filename
-                cloud_filename = filename
-                if cloud_filename.startswith("downloads_"):
-                    cloud_filename = cloud_filename[len("downloads_"):]
-
-                # Build destination key including folder_prefix
-                cloud_key = f"{self.folder_prefix}{cloud_filename}"
+                cloud_key = self._get_cloud_key(os.path.basename(video_path))
                 local_dir = self.bucket_name or self.config.get("local_path", "/tmp/videos")
                 destination = os.path.join(local_dir, cloud_key)
 
@@ -120,7 +160,6 @@ class CloudStorageUploader:
                     return True, None
 
                 # Copy video locally
-                import shutil
                 shutil.copy2(video_path, destination)
 
                 self.logger.info(f"Successfully copied {video_path} to local storage at {destination}")
@@ -142,18 +181,14 @@ class CloudStorageUploader:
         
         try:
             # Generate cloud storage key/path
-            filename = os.path.basename(video_path)
-            # Strip any leading "downloads_" from the filename
-            cloud_filename = filename
-            if cloud_filename.startswith("downloads_"):
-                cloud_filename = cloud_filename[len("downloads_"):]
-            cloud_key = f"{self.folder_prefix}{cloud_filename}"
-            
-            # Check if already uploaded
-            if self._is_already_uploaded(video_path, cloud_key):
-                self.logger.info(f"File {video_path} already uploaded as {cloud_key}")
+            cloud_key = self._get_cloud_key(os.path.basename(video_path))
+            
+            # Check if already uploaded, possibly under another name
+            uploaded_key = self._find_uploaded_key(video_path, cloud_key)
+            if uploaded_key:
+                self.logger.info(f"File {video_path} already uploaded as {uploaded_key}")
                 # Format return as (success: bool, url_or_none: Optional[str])
-                return True, self._get_public_url(cloud_key)
+                return True, self._get_public_url(uploaded_key)
             
             # Upload with retries
             for attempt in range(self.max_retries):
@@ -168,13 +203,13 @@ class CloudStorageUploader:
                             video_path, 
                             self.bucket_name, 
                             cloud_key,
-                            ExtraArgs=extra_args
+                            ExtraArgs=extra_args,
+                            Config=self.transfer_config
                         )
                         
                     elif self.provider == "gcp":
                         # Upload to Google Cloud Storage
-                        bucket = self.client.bucket(self.bucket_name)
-                        blob = bucket.blob(cloud_key)
+                        blob = self._gcp_bucket.blob(cloud_key, chunk_size=self.multipart_chunksize)
                         
                         if metadata:
                             blob.metadata = {k: str(v) for k, v in metadata.items() if isinstance(v, (str, int, float, bool))}
@@ -183,15 +218,13 @@ class CloudStorageUploader:
                         
                     elif self.provider == "azure":
                         # Upload to Azure Blob Storage
-                        blob_client = self.client.get_blob_client(
-                            container=self.bucket_name, 
-                            blob=cloud_key
-                        )
+                        blob_client = self._azure_container.get_blob_client(cloud_key)
                         
                         with open(video_path, "rb") as data:
                             blob_client.upload_blob(
                                 data, 
                                 overwrite=True,
+                                max_concurrency=self.max_concurrency,
                                 metadata={k: str(v) for k, v in (metadata or {}).items() if isinstance(v, (str, int, float, bool))}
                             )
                     
@@ -238,45 +271,233 @@ class CloudStorageUploader:
             # Format return as (success: bool, url_or_none: Optional[str])
             return False, str(e)
     
-    def _is_already_uploaded(self, video_path: str, cloud_key: str) -> bool:
+    def upload_stream(self, fileobj, filename: str, metadata: Dict[str, Any] = None) -> Tuple[bool, Optional[str]]:
         """
-        Check if a video has already been uploaded.
+        Upload a video from a readable stream without staging it on local disk.
+        
+        Used to pipe a download response body straight into the bucket. The
+        stream can only be read once, so there are no retries. A stream has no
+        content hash, so duplicates are found by cloud key only, and the upload
+        is recorded in the remote object index rather than the upload history.
         
         Args:
-            video_path: Local path to the video
-            cloud_key: Cloud storage key/path
+            fileobj: Readable binary stream, e.g. ``response.raw``
+            filename: File name used to build the cloud key
+            metadata: Optional metadata to store with the video
             
         Returns:
-            True if already uploaded, False otherwise
+            Tuple of (success, public URL or error message)
         """
-        # First check in upload history
-        file_hash = self._get_file_hash(video_path)
-        if file_hash in self.upload_history:
-            return True
+        cloud_key = self._get_cloud_key(filename)
+        string_metadata = {k: str(v) for k, v in (metadata or {}).items() if isinstance(v, (str, int, float, bool))}
+        
+        try:
+            if self.provider == "local":
+                local_dir = self.bucket_name or self.config.get("local_path", "/tmp/videos")
+                destination = os.path.join(local_dir, cloud_key)
+                if os.path.exists(destination):
+                    self.logger.info(f"{filename} already exists at {destination}")
+                    return True, None
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+                with open(destination, "wb") as f:
+                    shutil.copyfileobj(fileobj, f, length=MB)
+                return True, None
+            
+            if not self.client:
+                return False, f"Cloud client not initialized for {self.provider}"
+            
+            uploaded_key = self._find_uploaded_key(None, cloud_key)
+            if uploaded_key:
+                self.logger.info(f"{filename} already uploaded as {uploaded_key}")
+                return True, self._get_public_url(uploaded_key)
+            
+            if self.provider == "aws":
+                self.client.upload_fileobj(
+                    fileobj,
+                    self.bucket_name,
+                    cloud_key,
+                    ExtraArgs={"Metadata": string_metadata} if string_metadata else {},
+                    Config=self.transfer_config
+                )
+            
+            elif self.provider == "gcp":
+                blob = self._gcp_bucket.blob(cloud_key, chunk_size=self.multipart_chunksize)
+                if string_metadata:
+                    blob.metadata = string_metadata
+                blob.upload_from_file(fileobj, rewind=False)
+            
+            elif self.provider == "azure":
+                blob_client = self._azure_container.get_blob_client(cloud_key)
+                blob_client.upload_blob(
+                    fileobj,
+                    overwrite=True,
+                    max_concurrency=self.max_concurrency,
+                    metadata=string_metadata
+                )
+            
+            self._record_remote_object(cloud_key)
+            self.logger.info(f"Successfully streamed {filename} to {self.provider}:{self.bucket_name}/{cloud_key}")
+            return True, self._get_public_url(cloud_key)
+            
+        except Exception as e:
+            self.logger.error(f"Error streaming {filename} to {self.provider}: {str(e)}")
+            return False, str(e)
+    
+    def upload_videos(self, paths_and_metadata: List[Tuple[str, Dict[str, Any]]]) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Upload several video files concurrently.
+        
+        Uploads mostly wait on the network, so they are spread over a thread
+        pool that shares this uploader's client and upload history.
+        
+        Args:
+            paths_and_metadata: List of (video_path, metadata) pairs
+            
+        Returns:
+            List of (success, url_or_error) results, in the same order as the input
+        """
+        results = [None] * len(paths_and_metadata)
+        if not paths_and_metadata:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=min(self.upload_workers, len(paths_and_metadata))) as executor:
+            futures = {
+                executor.submit(self.upload_video, video_path, metadata): index
+                for index, (video_path, metadata) in enumerate(paths_and_metadata)
+            }
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error uploading {paths_and_metadata[futures[future]][0]}: {str(e)}")
+                    results[futures[future]] = (False, str(e))
+        
+        return results
+    
+    def _get_cloud_key(self, filename: str) -> str:
+        """
+        Build the cloud storage key for a file name.
+        
+        Args:
+            filename: Base name of the video file
+            
+        Returns:
+            Cloud storage key/path under the folder prefix
+        """
+        # Strip any leading "downloads_" from the filename
+        if filename.startswith("downloads_"):
+            filename = filename[len("downloads_"):]
+        return f"{self.folder_prefix}{filename}"
+    
+    def _find_uploaded_key(self, video_path: Optional[str], cloud_key: str) -> Optional[str]:
+        """
+        Find where a video has already been uploaded.
+        
+        The same content may have been uploaded before under another name, so
+        the key recorded in the upload history is returned rather than cloud_key.
+        Without a local file (a streamed upload) only cloud_key itself is checked.
+        
+        Args:
+            video_path: Local path to the video, or None for a stream
+            cloud_key: Cloud storage key/path the video would be uploaded to
+            
+        Returns:
+            Cloud key of the existing object, or None if the video is not uploaded yet
+        """
+        # First check in upload history, then in the last bucket listing
+        file_key = self._get_file_key(video_path) if video_path else None
+        try:
+            if self._history_conn and file_key:
+                with self._history_lock:
+                    row = self._history_conn.execute(
+                        "SELECT cloud_key FROM uploads WHERE hash = ? AND size = ? AND provider = ? AND bucket = ? LIMIT 1",
+                        (*file_key, self.provider, self.bucket_name)
+                    ).fetchone() or self._history_conn.execute(
+                        "SELECT cloud_key FROM remote_objects WHERE cloud_key = ? AND size = ? LIMIT 1",
+                        (cloud_key, file_key[1])
+                    ).fetchone()
+                if row and row[0]:
+                    return row[0]
+            elif self._history_conn and not video_path:
+                with self._history_lock:
+                    row = self._history_conn.execute(
+                        "SELECT cloud_key FROM uploads WHERE cloud_key = ? AND provider = ? AND bucket = ? LIMIT 1",
+                        (cloud_key, self.provider, self.bucket_name)
+                    ).fetchone() or self._history_conn.execute(
+                        "SELECT cloud_key FROM remote_objects WHERE cloud_key = ? LIMIT 1", (cloud_key,)
+                    ).fetchone()
+                if row and row[0]:
+                    return row[0]
+        except Exception as e:
+            self.logger.warning(f"Error reading upload history: {str(e)}")
             
         # If not in history, try to check in cloud storage
         try:
             if self.provider == "aws" and self.client:
-                self.client.head_object(Bucket=self.bucket_name, Key=cloud_key)
-                # If no exception, file exists
-                return True
+                with self._head_cache_lock:
+                    exists = self._head_cache.get(cloud_key)
+                if exists is not None:
+                    return cloud_key if exists else None
+                
+                try:
+                    self.client.head_object(Bucket=self.bucket_name, Key=cloud_key)
+                    # If no exception, file exists
+                    exists = True
+                except ClientError as e:
+                    # Only a definite "not found" is worth remembering
+                    if e.response.get("Error", {}).get("Code") not in ("404", "NoSuchKey", "NotFound"):
+                        raise
+                    exists = False
+                
+                with self._head_cache_lock:
+                    self._head_cache[cloud_key] = exists
+                return cloud_key if exists else None
         except Exception:
             # File doesn't exist in cloud
             pass
             
-        return False
+        return None
+    
+    def _get_file_hash(self, file_path: str) -> Optional[str]:
+        """
+        Get a content hash of the file for deduplication.
+        
+        The file is streamed through BLAKE2b in 1 MiB chunks, so renamed copies
+        share a hash and rewritten files do not. Hashes are memoized by
+        (path, size, mtime), so a file is only read again after it changes.
+        Returns None if the file cannot be read.
+        """
+        file_key = self._get_file_key(file_path)
+        return file_key[0] if file_key else None
     
-    def _get_file_hash(self, file_path: str) -> str:
+    def _get_file_key(self, file_path: str) -> Optional[Tuple[str, int]]:
         """
-        Get a hash of the file for deduplication.
+        Get the (content hash, size) pair that identifies a file in the upload history.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Tuple of (hash, size in bytes), or None if the file cannot be read
         """
-        import hashlib, os
         try:
             stat = os.stat(file_path)
-            file_info = f"{file_path}:{stat.st_size}:{stat.st_mtime}"
-            return hashlib.md5(file_info.encode()).hexdigest()
-        except Exception:
-            return hashlib.md5(file_path.encode()).hexdigest()
+            cache_key = (file_path, stat.st_size, stat.st_mtime_ns)
+            with self._hash_cache_lock:
+                file_hash = self._hash_cache.get(cache_key)
+            if file_hash is None:
+                # BLAKE2b from hashlib: no extra dependency, and digests are identical on every machine
+                digest = hashlib.blake2b(digest_size=32)
+                with open(file_path, "rb", buffering=0) as f:
+                    while chunk := f.read(1 << 20):
+                        digest.update(chunk)
+                file_hash = digest.hexdigest()
+                with self._hash_cache_lock:
+                    self._hash_cache[cache_key] = file_hash
+            return file_hash, stat.st_size
+        except Exception as e:
+            self.logger.warning(f"Error hashing {file_path}: {str(e)}")
+            return None
     
     def _record_upload(self, video_path: str, cloud_key: str, metadata: Dict[str, Any] = None):
         """
@@ -288,46 +509,190 @@ class CloudStorageUploader:
             metadata: Optional metadata stored with the video
         """
         try:
-            file_hash = self._get_file_hash(video_path)
-            
-            self.upload_history[file_hash] = {
-                "local_path": video_path,
-                "cloud_key": cloud_key,
-                "provider": self.provider,
-                "bucket": self.bucket_name,
-                "timestamp": time.time(),
-                "metadata": metadata
-            }
+            file_key = self._get_file_key(video_path)
+            if not self._history_conn or not file_key:
+                return
+            
+            with self._history_lock:
+                self._history_conn.execute(
+                    "INSERT OR REPLACE INTO uploads (hash, size, local_path, cloud_key, provider, bucket, ts, metadata) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (*file_key, video_path, cloud_key, self.provider, self.bucket_name,
+                     time.time(), json.dumps(metadata, default=str))
+                )
             
-            # Save updated history
-            self._save_upload_history()
+            # The object now exists, whatever an earlier head_object said
+            with self._head_cache_lock:
+                self._head_cache[cloud_key] = True
             
         except Exception as e:
             self.logger.warning(f"Error recording upload history: {str(e)}")
     
-    def _load_upload_history(self) -> Dict[str, Any]:
+    def _record_remote_object(self, cloud_key: str):
+        """
+        Record an object written without a local file in the remote object index.
+        
+        Its size is not known, so it only answers dedup checks for streams.
+        
+        Args:
+            cloud_key: Cloud storage key/path
+        """
+        try:
+            if self._history_conn:
+                with self._history_lock:
+                    self._history_conn.execute(
+                        "INSERT OR REPLACE INTO remote_objects (cloud_key, size, etag, ts) VALUES (?, NULL, NULL, ?)",
+                        (cloud_key, time.time())
+                    )
+            
+            with self._head_cache_lock:
+                self._head_cache[cloud_key] = True
+            
+        except Exception as e:
+            self.logger.warning(f"Error recording streamed upload: {str(e)}")
+    
+    def _open_upload_history(self) -> Optional[sqlite3.Connection]:
         """
-        Load upload history from file.
+        Open (and create if needed) the SQLite upload history.
         
         Returns:
-            Dictionary of upload history
+            Database connection, or None if the history could not be opened
         """
         try:
-            if os.path.exists(self.upload_history_file):
-                with open(self.upload_history_file, "r") as f:
-                    return json.load(f)
-            return {}
+            history_dir = os.path.dirname(self.upload_history_db)
+            if history_dir:
+                os.makedirs(history_dir, exist_ok=True)
+            
+            # Autocommit mode; WAL keeps readers and the single writer from blocking each other
+            conn = sqlite3.connect(self.upload_history_db, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # Uploads are keyed by content, so the history holds across machines and moved files
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS uploads ("
+                "hash TEXT, size INTEGER, local_path TEXT, cloud_key TEXT, provider TEXT, "
+                "bucket TEXT, ts REAL, metadata TEXT, PRIMARY KEY (hash, size))"
+            )
+            # Objects known to be in the bucket: listed by rebuild_index or streamed there
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS remote_objects ("
+                "cloud_key TEXT PRIMARY KEY, size INTEGER, etag TEXT, ts REAL)"
+            )
+            self._import_legacy_history(conn)
+            return conn
+            
         except Exception as e:
-            self.logger.warning(f"Error loading upload history: {str(e)}")
-            return {}
+            self.logger.warning(f"Error opening upload history: {str(e)}")
+            return None
     
-    def _save_upload_history(self):
-        """Save upload history to file."""
+    def _import_legacy_history(self, conn: sqlite3.Connection):
+        """
+        Import a JSON upload history written by earlier versions into an empty database.
+        
+        Legacy entries are keyed by an md5 of path, size and mtime, which never
+        matches the content hashes looked up by _find_uploaded_key. Each
+        entry is rehashed from its local file; entries whose file is gone
+        cannot be rehashed and are skipped.
+        
+        Args:
+            conn: Open upload history connection
+        """
         try:
-            with open(self.upload_history_file, "w") as f:
-                json.dump(self.upload_history, f, indent=2)
+            if not os.path.exists(self.upload_history_file):
+                return
+            if conn.execute("SELECT 1 FROM uploads LIMIT 1").fetchone():
+                return
+            
+            with open(self.upload_history_file, "r") as f:
+                history = json.load(f)
+            
+            rows = []
+            skipped = 0
+            for entry in history.values():
+                local_path = entry.get("local_path")
+                file_key = self._get_file_key(local_path) if local_path and os.path.exists(local_path) else None
+                if not file_key:
+                    skipped += 1
+                    continue
+                rows.append((*file_key, local_path, entry.get("cloud_key"), entry.get("provider"),
+                             entry.get("bucket"), entry.get("timestamp"), json.dumps(entry.get("metadata"), default=str)))
+            
+            conn.executemany(
+                "INSERT OR IGNORE INTO uploads (hash, size, local_path, cloud_key, provider, bucket, ts, metadata) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self.logger.info(f"Imported {len(rows)} entries from {self.upload_history_file}")
+            if skipped:
+                self.logger.warning(f"Skipped {skipped} legacy history entries whose local file no longer exists")
+            
         except Exception as e:
-            self.logger.warning(f"Error saving upload history: {str(e)}")
+            self.logger.warning(f"Error importing upload history: {str(e)}")
+    
+    def rebuild_index(self) -> int:
+        """
+        Rebuild the index of objects already stored under the folder prefix.
+        
+        Walks the bucket listing page by page and stores each object's key, size
+        and ETag, so later dedup checks can be answered without a request per file.
+        ETags are kept for reference only; they are not content hashes for
+        multipart uploads and never match the BLAKE2b hashes in the history.
+        
+        Returns:
+            Number of objects indexed, or -1 on error
+        """
+        if not self.client or not self._history_conn:
+            self.logger.error(f"Cannot rebuild index for {self.provider}: no client or history")
+            return -1
+        
+        try:
+            # Page through the whole listing before locking, so uploads aren't held up by the network
+            now = time.time()
+            if self.provider == "aws":
+                paginator = self.client.get_paginator("list_objects_v2")
+                rows = [
+                    (obj["Key"], obj["Size"], obj.get("ETag", "").strip('"'), now)
+                    for page in paginator.paginate(Bucket=self.bucket_name, Prefix=self.folder_prefix)
+                    for obj in page.get("Contents", [])
+                ]
+            elif self.provider == "gcp":
+                rows = [
+                    (blob.name, blob.size, blob.etag, now)
+                    for blob in self.client.list_blobs(self.bucket_name, prefix=self.folder_prefix)
+                ]
+            elif self.provider == "azure":
+                rows = [
+                    (blob.name, blob.size, blob.etag, now)
+                    for blob in self._azure_container.list_blobs(name_starts_with=self.folder_prefix)
+                ]
+            else:
+                return -1
+            
+            with self._history_lock:
+                self._history_conn.execute("BEGIN")
+                try:
+                    self._history_conn.execute("DELETE FROM remote_objects")
+                    self._history_conn.executemany(
+                        "INSERT OR REPLACE INTO remote_objects (cloud_key, size, etag, ts) VALUES (?, ?, ?, ?)",
+                        rows
+                    )
+                    self._history_conn.execute("COMMIT")
+                except Exception:
+                    self._history_conn.execute("ROLLBACK")
+                    raise
+            
+            count = len(rows)
+            self.logger.info(f"Indexed {count} objects in {self.provider}:{self.bucket_name}/{self.folder_prefix}")
+            return count
+            
+        except Exception as e:
+            self.logger.error(f"Error rebuilding index for {self.provider}: {str(e)}")
+            return -1
+    
+    def close(self):
+        """Close the upload history database."""
+        if self._history_conn:
+            self._history_conn.close()
+            self._history_conn = None
     
     def _get_public_url(self, cloud_key: str) -> str:
         """
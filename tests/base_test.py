@@ -3,6 +3,10 @@ Base test configuration and utilities for all test modules.
 """
 
 import os
+import shutil
+import importlib
+import importlib.resources
+import tempfile
 import unittest
 import logging
 from unittest.mock import patch
@@ -11,28 +15,104 @@ from unittest.mock import patch
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Credentials the scrapers and uploaders read from the environment in tests
+TEST_ENV_VARS = {
+    'PEXELS_API_KEY': 'test_pexels_key',
+    'VIDEVO_API_KEY': 'test_videvo_key',
+    'NASA_API_KEY': 'test_nasa_key',
+    'IA_ACCESS_KEY': 'test_ia_key',
+    'IA_SECRET_KEY': 'test_ia_secret',
+    'NOAA_API_TOKEN': 'test_noaa_token',
+    'PIXABAY_API_KEY': 'test_pixabay_key',
+    'AWS_ACCESS_KEY_ID': 'test_aws_key',
+    'AWS_SECRET_ACCESS_KEY': 'test_aws_secret'
+}
+
 # Ensure environment variables are set for tests
 def setup_test_environment():
     """Set up environment variables for testing."""
-    test_env_vars = {
-        'PEXELS_API_KEY': 'test_pexels_key',
-        'VIDEVO_API_KEY': 'test_videvo_key',
-        'NASA_API_KEY': 'test_nasa_key',
-        'IA_ACCESS_KEY': 'test_ia_key',
-        'IA_SECRET_KEY': 'test_ia_secret',
-        'NOAA_API_TOKEN': 'test_noaa_token',
-        'PIXABAY_API_KEY': 'test_pixabay_key',
-        'AWS_ACCESS_KEY_ID': 'test_aws_key',
-        'AWS_SECRET_ACCESS_KEY': 'test_aws_secret'
-    }
-    
-    for var_name, default_value in test_env_vars.items():
+    for var_name, default_value in TEST_ENV_VARS.items():
         if var_name not in os.environ:
             os.environ[var_name] = default_value
 
 # Call setup at import time
 setup_test_environment()
 
+def get_or_build_sample_video(width, height, fps, duration):
+    """
+    Return the path of a cached sample video, encoding it on first use.
+    
+    The file lives in the system temp directory and is keyed by its
+    parameters, so later runs skip the OpenCV encode entirely.
+    Returns None if OpenCV is not available.
+    """
+    cache_path = os.path.join(
+        tempfile.gettempdir(),
+        f"pipeline_test_sample_{width}x{height}x{fps}x{duration}.mp4"
+    )
+    if os.path.isfile(cache_path) and os.path.getsize(cache_path) > 0:
+        return cache_path
+    
+    try:
+        import cv2
+        import numpy as np
+    except ImportError:
+        return None
+    
+    # Encode to a private file first so a concurrent run never sees a partial video
+    tmp_path = f"{cache_path[:-4]}.{os.getpid()}.mp4"
+    
+    # Initialize video writer
+    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+    out = cv2.VideoWriter(tmp_path, fourcc, fps, (width, height))
+    
+    # Create frames, reusing one buffer since the writer copies each frame
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    for i in range(fps * duration):
+        # Clear the frame before drawing the moving rectangle
+        frame.fill(0)
+        
+        # Add a moving rectangle
+        x = int(width * (i / (fps * duration)))
+        cv2.rectangle(frame, (x, height // 4), (x + width // 8, height // 2), (0, 255, 0), -1)
+        
+        # Add frame to video
+        out.write(frame)
+    
+    # Release video writer
+    out.release()
+    
+    os.replace(tmp_path, cache_path)
+    logger.info(f"Created sample video at {cache_path}")
+    return cache_path
+
+# A checked-in ~1 KB MP4 holding a single black 64x64 frame
+MINIMAL_MP4 = importlib.resources.files("tests").joinpath("fixtures").joinpath("minimal.mp4").read_bytes()
+
+def create_sample_video(path, real=True, width=64, height=64, fps=1, duration=1):
+    """
+    Place a sample video file at path for testing.
+    
+    With real=True the cached OpenCV encode is copied in; otherwise, or if
+    OpenCV is not available, the pre-baked MINIMAL_MP4 is written instead.
+    """
+    cached_path = get_or_build_sample_video(width, height, fps, duration) if real else None
+    
+    if cached_path:
+        shutil.copy(cached_path, path)
+        logger.info(f"Copied cached sample video to {path}")
+    else:
+        with open(path, "wb") as f:
+            f.write(MINIMAL_MP4)
+        
+        if real:
+            logger.warning(f"Wrote the minimal sample video to {path} (OpenCV not available)")
+
+def load_scraper(target):
+    """Import and return the scraper class named by a "module:Class" target."""
+    module_name, class_name = target.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
 class BaseTestCase(unittest.TestCase):
     """Base test case with common utilities for all tests."""
     
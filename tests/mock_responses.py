@@ -2,15 +2,26 @@
 Test utilities for mocking HTTP responses in scraper tests.
 """
 
-import os
+import re
 import json
-import requests
-from unittest.mock import MagicMock
+import types
+import functools
+from requests.exceptions import HTTPError
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+# Headers of every response created without any; read-only because it is shared
+_EMPTY_HEADERS = types.MappingProxyType({})
 
 class MockResponse:
     """Mock HTTP response for testing."""
     
-    def __init__(self, status_code=200, json_data=None, content=None, headers=None):
+    __slots__ = ("status_code", "_json_data", "_json_bytes", "_content", "headers")
+    
+    def __init__(self, status_code=200, json_data=None, content=None, headers=None, json_bytes=None):
         """
         Initialize mock response.
         
@@ -19,17 +30,26 @@ class MockResponse:
             json_data: JSON data to return from json() method
             content: Content to return from content property
             headers: Response headers
+            json_bytes: Encoded JSON body, decoded afresh by each json() call
         """
         self.status_code = status_code
         self._json_data = json_data
-        self._content = content if content is not None else b""
-        self.headers = headers or {}
-        
-        # For streaming responses
-        self._iter_content_data = [self._content]
+        self._json_bytes = json_bytes
+        if content is None:
+            # Like a real response, the body of a JSON response is its encoded JSON
+            if json_bytes is not None:
+                content = json_bytes
+            else:
+                has_json = json_data is not None and not isinstance(json_data, Exception)
+                content = json.dumps(json_data).encode() if has_json else b""
+        self._content = content
+        self.headers = headers if headers is not None else _EMPTY_HEADERS
     
     def json(self):
         """Return JSON data."""
+        if self._json_bytes is not None:
+            # Responses are shared between tests, so every caller gets its own copy
+            return _loads(self._json_bytes)
         if isinstance(self._json_data, Exception):
             raise self._json_data
         return self._json_data
@@ -40,357 +60,484 @@ class MockResponse:
         return self._content
     
     def iter_content(self, chunk_size=1):
-        """Iterate over content in chunks."""
-        for chunk in self._iter_content_data:
-            yield chunk
+        """Iterate over content in chunks of chunk_size bytes, like requests does."""
+        if not chunk_size:
+            yield self._content
+            return
+        view = memoryview(self._content)
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start:start + chunk_size])
     
     def raise_for_status(self):
         """Raise exception if status code indicates an error."""
         if self.status_code >= 400:
-            raise requests.HTTPError(f"HTTP Error: {self.status_code}")
+            raise HTTPError(f"HTTP Error: {self.status_code}")
 
 
-def create_mock_scraper_responses():
+def _encode(payload):
+    """Serialize a fixture payload to the bytes a real response body would hold."""
+    return json.dumps(payload).encode()
+
+
+# Shared response for any URL a handler does not know
+_NOT_FOUND = MockResponse(404)
+
+
+@functools.lru_cache(maxsize=128)
+def _route(routes, url):
     """
-    Create a dictionary of mock responses for different scrapers.
+    Return the response of the first route whose substring occurs in the URL.
     
+    Routes and responses never change, so the answer for a URL is memoized.
+    
+    Args:
+        routes: Tuple of (URL substring, response) pairs, checked in order
+        url: Requested URL
+        
     Returns:
-        Dictionary mapping scraper names to mock response functions
+        Matching response, or the shared 404 response
     """
-    mock_responses = {}
-    
-    # Pexels mock response
-    def mock_pexels_response(*args, **kwargs):
-        if "videos/search" in args[0]:
-            return MockResponse(200, {
-                "videos": [
-                    {
-                        "id": 1234,
-                        "url": "https://www.pexels.com/video/test-video-1234/",
-                        "image": "https://example.com/thumbnail.jpg",
-                        "duration": 10,
-                        "user": {"name": "Test User"},
-                        "video_files": [
-                            {
-                                "link": "https://example.com/video.mp4",
-                                "width": 1920,
-                                "height": 1080,
-                                "fps": 30,
-                                "file_type": "video/mp4"
-                            }
-                        ]
-                    }
-                ]
-            })
-        elif "videos/" in args[0]:
-            return MockResponse(200, {
-                "id": 1234,
-                "url": "https://www.pexels.com/video/test-video-1234/",
-                "image": "https://example.com/thumbnail.jpg",
-                "duration": 10,
-                "user": {"name": "Test User"},
-                "video_files": [
-                    {
-                        "link": "https://example.com/video.mp4",
-                        "width": 1920,
-                        "height": 1080,
-                        "fps": 30,
-                        "file_type": "video/mp4"
-                    }
-                ]
-            })
-        else:
-            return MockResponse(404)
-    
-    mock_responses["pexels"] = mock_pexels_response
-    
-    # Pixabay mock response
-    def mock_pixabay_response(*args, **kwargs):
-        if "videos" in args[0]:
-            return MockResponse(200, {
-                "totalHits": 1,
-                "hits": [
-                    {
-                        "id": 1234,
-                        "pageURL": "https://pixabay.com/videos/test-video-1234/",
-                        "tags": "nature,landscape,mountains",
-                        "duration": 10,
-                        "user": "TestUser",
-                        "userImageURL": "https://example.com/user.jpg",
-                        "videos": {
-                            "large": {
-                                "url": "https://example.com/video_large.mp4",
-                                "width": 1920,
-                                "height": 1080,
-                                "size": 12345
-                            },
-                            "medium": {
-                                "url": "https://example.com/video_medium.mp4",
-                                "width": 1280,
-                                "height": 720,
-                                "size": 6789
-                            }
-                        }
-                    }
-                ]
-            })
-        else:
-            return MockResponse(404)
-    
-    mock_responses["pixabay"] = mock_pixabay_response
-    
-    # Videvo mock response
-    def mock_videvo_response(*args, **kwargs):
-        if "videos" in args[0]:
-            return MockResponse(200, {
-                "data": [
-                    {
-                        "id": "1234",
-                        "title": "Test Video",
-                        "description": "A test video description",
-                        "url": "https://www.videvo.net/video/test-video/1234/",
-                        "thumbnail": "https://example.com/thumbnail.jpg",
-                        "clip": {
-                            "url": "https://example.com/video.mp4",
-                            "width": 1920,
-                            "height": 1080,
-                            "duration": 10
-                        },
-                        "contributor": {
-                            "name": "Test User"
-                        },
-                        "tags": ["nature", "landscape"]
-                    }
-                ],
-                "meta": {
-                    "pagination": {
-                        "total": 1,
-                        "count": 1,
-                        "per_page": 10,
-                        "current_page": 1,
-                        "total_pages": 1
-                    }
-                }
-            })
-        else:
-            return MockResponse(404)
-    
-    mock_responses["videvo"] = mock_videvo_response
-    
-    # NASA mock response
-    def mock_nasa_response(*args, **kwargs):
-        if "search" in args[0]:
-            return MockResponse(200, {
-                "collection": {
-                    "items": [
-                        {
-                            "href": "https://images-assets.nasa.gov/video/test-video/collection.json",
-                            "data": [
-                                {
-                                    "nasa_id": "test-video",
-                                    "title": "Test NASA Video",
-                                    "description": "A test NASA video",
-                                    "media_type": "video",
-                                    "date_created": "2023-01-01T00:00:00Z",
-                                    "keywords": ["space", "test"]
-                                }
-                            ],
-                            "links": [
-                                {
-                                    "href": "https://example.com/thumbnail.jpg",
-                                    "rel": "preview",
-                                    "render": "image"
-                                }
-                            ]
-                        }
-                    ]
-                }
-            })
-        elif "collection.json" in args[0]:
-            return MockResponse(200, {
-                "collection": {
-                    "items": [
-                        {
-                            "href": "https://example.com/video.mp4",
-                            "size": 12345678
-                        }
-                    ]
-                }
-            })
-        else:
-            return MockResponse(404)
-    
-    mock_responses["nasa"] = mock_nasa_response
-    
-    # Internet Archive mock response
-    def mock_ia_response(*args, **kwargs):
-        if "advancedsearch.php" in args[0]:
-            return MockResponse(200, {
-                "response": {
-                    "docs": [
-                        {
-                            "identifier": "test-video",
-                            "title": "Test Internet Archive Video",
-                            "description": "A test video from Internet Archive",
-                            "mediatype": "movies",
-                            "format": ["h.264", "mp4"],
-                            "creator": "Test Creator",
-                            "subject": ["test", "archive"],
-                            "downloads": 100,
-                            "item_size": 12345678,
-                            "publicdate": "2023-01-01T00:00:00Z"
-                        }
-                    ],
-                    "numFound": 1
+    for substring, response in routes:
+        if substring in url:
+            return response
+    return _NOT_FOUND
+
+
+# Payloads are serialized once at import and the responses wrapping them are
+# shared, as is the object json() decodes; tests must treat it as read-only
+
+# Values that several scrapers' fixtures have in common
+_VIDEO_URL = "https://example.com/video.mp4"
+_THUMBNAIL_URL = "https://example.com/thumbnail.jpg"
+_USER_NAME = "Test User"
+_TIMESTAMP = "2023-01-01T00:00:00Z"
+
+
+# Pexels mock response
+_PEXELS_VIDEO_PAYLOAD = {
+    "id": 1234,
+    "url": "https://www.pexels.com/video/test-video-1234/",
+    "image": _THUMBNAIL_URL,
+    "duration": 10,
+    "user": {"name": _USER_NAME},
+    "video_files": [
+        {
+            "link": _VIDEO_URL,
+            "width": 1920,
+            "height": 1080,
+            "fps": 30,
+            "file_type": "video/mp4"
+        }
+    ]
+}
+_PEXELS_VIDEO_JSON = _encode(_PEXELS_VIDEO_PAYLOAD)
+
+# The search endpoint wraps the same video object in a list
+_PEXELS_SEARCH_PAYLOAD = {"videos": [_PEXELS_VIDEO_PAYLOAD]}
+_PEXELS_SEARCH_JSON = _encode(_PEXELS_SEARCH_PAYLOAD)
+
+_PEXELS_ROUTES = (
+    ("videos/search", MockResponse(200, json_bytes=_PEXELS_SEARCH_JSON)),
+    ("videos/", MockResponse(200, json_bytes=_PEXELS_VIDEO_JSON)),
+)
+
+
+def mock_pexels_response(url, *args, **kwargs):
+    return _route(_PEXELS_ROUTES, url)
+
+
+# Pixabay mock response
+_PIXABAY_SEARCH_PAYLOAD = {
+    "totalHits": 1,
+    "hits": [
+        {
+            "id": 1234,
+            "pageURL": "https://pixabay.com/videos/test-video-1234/",
+            "tags": "nature,landscape,mountains",
+            "duration": 10,
+            "user": "TestUser",
+            "userImageURL": "https://example.com/user.jpg",
+            "videos": {
+                "large": {
+                    "url": "https://example.com/video_large.mp4",
+                    "width": 1920,
+                    "height": 1080,
+                    "size": 12345
+                },
+                "medium": {
+                    "url": "https://example.com/video_medium.mp4",
+                    "width": 1280,
+                    "height": 720,
+                    "size": 6789
                 }
-            })
-        else:
-            return MockResponse(404)
-    
-    mock_responses["internet_archive"] = mock_ia_response
-    
-    # Wikimedia mock response
-    def mock_wikimedia_response(*args, **kwargs):
-        if "api.php" in args[0]:
-            params = kwargs.get("params", {})
-            if params.get("action") == "query" and params.get("list") == "search":
-                return MockResponse(200, {
-                    "query": {
-                        "search": [
-                            {
-                                "title": "File:Test_Video.webm",
-                                "pageid": 12345,
-                                "snippet": "A test video from Wikimedia Commons"
-                            }
-                        ]
-                    }
-                })
-            elif params.get("action") == "query" and params.get("prop") == "imageinfo":
-                return MockResponse(200, {
-                    "query": {
-                        "pages": {
-                            "12345": {
-                                "pageid": 12345,
-                                "title": "File:Test_Video.webm",
-                                "imageinfo": [
-                                    {
-                                        "url": "https://upload.wikimedia.org/wikipedia/commons/test/Test_Video.webm",
-                                        "descriptionurl": "https://commons.wikimedia.org/wiki/File:Test_Video.webm",
-                                        "width": 1920,
-                                        "height": 1080,
-                                        "size": 12345678,
-                                        "user": "Test User",
-                                        "timestamp": "2023-01-01T00:00:00Z",
-                                        "extmetadata": {
-                                            "ImageDescription": {
-                                                "value": "A test video from Wikimedia Commons"
-                                            },
-                                            "Categories": {
-                                                "value": "Test videos|Wikimedia Commons"
-                                            },
-                                            "License": {
-                                                "value": "CC BY-SA 4.0"
-                                            }
-                                        }
-                                    }
-                                ]
-                            }
-                        }
-                    }
-                })
-        return MockResponse(404)
-    
-    mock_responses["wikimedia"] = mock_wikimedia_response
-    
-    # Coverr mock response
-    def mock_coverr_response(*args, **kwargs):
-        if "api/videos" in args[0]:
-            return MockResponse(200, {
+            }
+        }
+    ]
+}
+_PIXABAY_SEARCH_JSON = _encode(_PIXABAY_SEARCH_PAYLOAD)
+
+
+_PIXABAY_ROUTES = (
+    ("videos", MockResponse(200, json_bytes=_PIXABAY_SEARCH_JSON)),
+)
+
+
+def mock_pixabay_response(url, *args, **kwargs):
+    return _route(_PIXABAY_ROUTES, url)
+
+
+# Videvo mock response
+_VIDEVO_SEARCH_PAYLOAD = {
+    "data": [
+        {
+            "id": "1234",
+            "title": "Test Video",
+            "description": "A test video description",
+            "url": "https://www.videvo.net/video/test-video/1234/",
+            "thumbnail": _THUMBNAIL_URL,
+            "clip": {
+                "url": _VIDEO_URL,
+                "width": 1920,
+                "height": 1080,
+                "duration": 10
+            },
+            "contributor": {
+                "name": _USER_NAME
+            },
+            "tags": ["nature", "landscape"]
+        }
+    ],
+    "meta": {
+        "pagination": {
+            "total": 1,
+            "count": 1,
+            "per_page": 10,
+            "current_page": 1,
+            "total_pages": 1
+        }
+    }
+}
+_VIDEVO_SEARCH_JSON = _encode(_VIDEVO_SEARCH_PAYLOAD)
+
+
+_VIDEVO_ROUTES = (
+    ("videos", MockResponse(200, json_bytes=_VIDEVO_SEARCH_JSON)),
+)
+
+
+def mock_videvo_response(url, *args, **kwargs):
+    return _route(_VIDEVO_ROUTES, url)
+
+
+# NASA mock response
+_NASA_SEARCH_PAYLOAD = {
+    "collection": {
+        "items": [
+            {
+                "href": "https://images-assets.nasa.gov/video/test-video/collection.json",
                 "data": [
                     {
-                        "id": "test-video",
-                        "attributes": {
-                            "name": "Test Coverr Video",
-                            "description": "A test video from Coverr",
-                            "width": 1920,
-                            "height": 1080,
-                            "duration": 10,
-                            "preview": "https://example.com/thumbnail.jpg",
-                            "mp4": "https://example.com/video.mp4",
-                            "tags": ["nature", "test"]
-                        }
+                        "nasa_id": "test-video",
+                        "title": "Test NASA Video",
+                        "description": "A test NASA video",
+                        "media_type": "video",
+                        "date_created": _TIMESTAMP,
+                        "keywords": ["space", "test"]
                     }
                 ],
-                "meta": {
-                    "pagination": {
-                        "total": 1,
-                        "count": 1,
-                        "per_page": 10,
-                        "current_page": 1,
-                        "total_pages": 1
-                    }
-                }
-            })
-        else:
-            return MockResponse(404)
-    
-    mock_responses["coverr"] = mock_coverr_response
-    
-    # NOAA mock response
-    def mock_noaa_response(*args, **kwargs):
-        if "datasets" in args[0]:
-            return MockResponse(200, {
-                "results": [
+                "links": [
                     {
-                        "id": "test-dataset",
-                        "name": "Test NOAA Dataset",
-                        "description": "A test dataset from NOAA"
+                        "href": _THUMBNAIL_URL,
+                        "rel": "preview",
+                        "render": "image"
                     }
-                ],
-                "metadata": {
-                    "resultset": {
-                        "count": 1,
-                        "limit": 10,
-                        "offset": 0
-                    }
-                }
-            })
-        elif "data" in args[0]:
-            return MockResponse(200, {
-                "results": [
+                ]
+            }
+        ]
+    }
+}
+_NASA_SEARCH_JSON = _encode(_NASA_SEARCH_PAYLOAD)
+
+_NASA_COLLECTION_PAYLOAD = {
+    "collection": {
+        "items": [
+            {
+                "href": _VIDEO_URL,
+                "size": 12345678
+            }
+        ]
+    }
+}
+_NASA_COLLECTION_JSON = _encode(_NASA_COLLECTION_PAYLOAD)
+
+
+_NASA_ROUTES = (
+    ("search", MockResponse(200, json_bytes=_NASA_SEARCH_JSON)),
+    ("collection.json", MockResponse(200, json_bytes=_NASA_COLLECTION_JSON)),
+)
+
+
+def mock_nasa_response(url, *args, **kwargs):
+    return _route(_NASA_ROUTES, url)
+
+
+# Internet Archive mock response
+_IA_SEARCH_PAYLOAD = {
+    "response": {
+        "docs": [
+            {
+                "identifier": "test-video",
+                "title": "Test Internet Archive Video",
+                "description": "A test video from Internet Archive",
+                "mediatype": "movies",
+                "format": ["h.264", "mp4"],
+                "creator": "Test Creator",
+                "subject": ["test", "archive"],
+                "downloads": 100,
+                "item_size": 12345678,
+                "publicdate": _TIMESTAMP
+            }
+        ],
+        "numFound": 1
+    }
+}
+_IA_SEARCH_JSON = _encode(_IA_SEARCH_PAYLOAD)
+
+
+_IA_ROUTES = (
+    ("advancedsearch.php", MockResponse(200, json_bytes=_IA_SEARCH_JSON)),
+)
+
+
+def mock_ia_response(url, *args, **kwargs):
+    return _route(_IA_ROUTES, url)
+
+
+# Wikimedia mock response
+_WIKIMEDIA_IMAGEINFO_PAYLOAD = {
+    "query": {
+        "pages": {
+            "12345": {
+                "pageid": 12345,
+                "title": "File:Test_Video.webm",
+                "index": 1,
+                "imageinfo": [
                     {
-                        "id": "test-video",
-                        "name": "Test NOAA Video",
-                        "description": "A test video from NOAA",
-                        "url": "https://example.com/video.mp4",
-                        "thumbnail": "https://example.com/thumbnail.jpg",
+                        "url": "https://upload.wikimedia.org/wikipedia/commons/test/Test_Video.webm",
+                        "descriptionurl": "https://commons.wikimedia.org/wiki/File:Test_Video.webm",
                         "width": 1920,
                         "height": 1080,
-                        "duration": 10,
-                        "date": "2023-01-01T00:00:00Z"
-                    }
-                ],
-                "metadata": {
-                    "resultset": {
-                        "count": 1,
-                        "limit": 10,
-                        "offset": 0
+                        "size": 12345678,
+                        "user": _USER_NAME,
+                        "timestamp": _TIMESTAMP,
+                        "mime": "video/webm",
+                        "extmetadata": {
+                            "ImageDescription": {
+                                "value": "A test video from Wikimedia Commons"
+                            },
+                            "Categories": {
+                                "value": "Test videos|Wikimedia Commons"
+                            },
+                            "License": {
+                                "value": "CC BY-SA 4.0"
+                            }
+                        }
                     }
-                }
-            })
-        else:
-            return MockResponse(404)
+                ]
+            }
+        }
+    }
+}
+_WIKIMEDIA_IMAGEINFO_JSON = _encode(_WIKIMEDIA_IMAGEINFO_PAYLOAD)
+
+
+# Keyed by (action, list or prop); searches (generator=search) and title
+# lookups both ask for prop=imageinfo
+_WIKIMEDIA_ROUTES = {
+    ("query", "imageinfo"): MockResponse(200, json_bytes=_WIKIMEDIA_IMAGEINFO_JSON),
+}
+
+
+def mock_wikimedia_response(url, *args, **kwargs):
+    params = kwargs.get("params") or {}
+    return _WIKIMEDIA_ROUTES.get((params.get("action"), params.get("list") or params.get("prop")), _NOT_FOUND)
+
+
+# Coverr mock response
+_COVERR_VIDEOS_PAYLOAD = {
+    "data": [
+        {
+            "id": "test-video",
+            "attributes": {
+                "name": "Test Coverr Video",
+                "description": "A test video from Coverr",
+                "width": 1920,
+                "height": 1080,
+                "duration": 10,
+                "preview": _THUMBNAIL_URL,
+                "mp4": _VIDEO_URL,
+                "tags": ["nature", "test"]
+            }
+        }
+    ],
+    "meta": {
+        "pagination": {
+            "total": 1,
+            "count": 1,
+            "per_page": 10,
+            "current_page": 1,
+            "total_pages": 1
+        }
+    }
+}
+_COVERR_VIDEOS_JSON = _encode(_COVERR_VIDEOS_PAYLOAD)
+
+
+_COVERR_ROUTES = (
+    ("api/videos", MockResponse(200, json_bytes=_COVERR_VIDEOS_JSON)),
+)
+
+
+def mock_coverr_response(url, *args, **kwargs):
+    return _route(_COVERR_ROUTES, url)
+
+
+# NOAA mock response
+_NOAA_DATASETS_PAYLOAD = {
+    "results": [
+        {
+            "id": "test-dataset",
+            "name": "Test NOAA Dataset",
+            "description": "A test dataset from NOAA"
+        }
+    ],
+    "metadata": {
+        "resultset": {
+            "count": 1,
+            "limit": 10,
+            "offset": 0
+        }
+    }
+}
+_NOAA_DATASETS_JSON = _encode(_NOAA_DATASETS_PAYLOAD)
+
+_NOAA_DATA_PAYLOAD = {
+    "results": [
+        {
+            "id": "test-video",
+            "name": "Test NOAA Video",
+            "description": "A test video from NOAA",
+            "url": _VIDEO_URL,
+            "thumbnail": _THUMBNAIL_URL,
+            "width": 1920,
+            "height": 1080,
+            "duration": 10,
+            "date": _TIMESTAMP
+        }
+    ],
+    "metadata": {
+        "resultset": {
+            "count": 1,
+            "limit": 10,
+            "offset": 0
+        }
+    }
+}
+_NOAA_DATA_JSON = _encode(_NOAA_DATA_PAYLOAD)
+
+
+_NOAA_ROUTES = (
+    ("datasets", MockResponse(200, json_bytes=_NOAA_DATASETS_JSON)),
+    ("data", MockResponse(200, json_bytes=_NOAA_DATA_JSON)),
+)
+
+
+def mock_noaa_response(url, *args, **kwargs):
+    return _route(_NOAA_ROUTES, url)
+
+
+# Generic download response
+_DOWNLOAD = MockResponse(200, content=b"test video content")
+
+
+def mock_download_response(url, *args, **kwargs):
+    return _DOWNLOAD
+
+
+# Hosts served by each handler, for dispatch(). Media hosts come first: the
+# leftmost match wins, so upload.wikimedia.org is a download, not an API call.
+_HOSTS = (
+    (mock_download_response, ("upload.wikimedia.org", "example.com")),
+    (mock_pexels_response, ("pexels.com",)),
+    (mock_pixabay_response, ("pixabay.com",)),
+    (mock_videvo_response, ("videvo.net",)),
+    (mock_nasa_response, ("nasa.gov",)),
+    (mock_ia_response, ("archive.org",)),
+    (mock_wikimedia_response, ("wikimedia.org",)),
+    (mock_coverr_response, ("coverr.co",)),
+    (mock_noaa_response, ("noaa.gov",)),
+)
+_HOST_PATTERN = re.compile("|".join(
+    f"(?P<h{index}>{'|'.join(map(re.escape, hosts))})" for index, (_, hosts) in enumerate(_HOSTS)
+))
+
+
+def dispatch(url, *args, **kwargs):
+    """
+    Route a request to the handler for its host.
     
-    mock_responses["noaa"] = mock_noaa_response
+    Usable as the side_effect of a patched ``requests.get`` or
+    ``Session.get`` when a test talks to several sources. All host names are
+    compiled into one alternation, so a single regex search picks the handler.
     
-    # Generic download response
-    def mock_download_response(*args, **kwargs):
-        return MockResponse(200, content=b"test video content")
+    Args:
+        url: Requested URL
+        *args: Remaining positional arguments of the request
+        **kwargs: Keyword arguments of the request (e.g. params)
+        
+    Returns:
+        Mock response from the matching handler, or the shared 404 response
+    """
+    match = _HOST_PATTERN.search(url)
+    if match is None:
+        return _NOT_FOUND
+    handler = _HOSTS[int(match.lastgroup[1:])][0]
+    return handler(url, *args, **kwargs)
+
+
+def create_mock_scraper_responses():
+    """
+    Create a dictionary of mock responses for different scrapers.
     
-    mock_responses["download"] = mock_download_response
+    The handlers are plain module-level functions, so this only builds the
+    registry; no response is built until a handler is called.
     
-    return mock_responses
+    Returns:
+        Dictionary mapping scraper names to mock response functions
+    """
+    # Each handler is called with the arguments of the patched request
+    return {
+        "pexels": mock_pexels_response,
+        "pixabay": mock_pixabay_response,
+        "videvo": mock_videvo_response,
+        "nasa": mock_nasa_response,
+        "internet_archive": mock_ia_response,
+        "wikimedia": mock_wikimedia_response,
+        "coverr": mock_coverr_response,
+        "noaa": mock_noaa_response,
+        "download": mock_download_response
+    }
 
 
-# Create mock responses at module level for easy import
-MOCK_RESPONSES = create_mock_scraper_responses()
+def __getattr__(name):
+    """
+    Build MOCK_RESPONSES on first access (PEP 562).
+    
+    ``from tests.mock_responses import MOCK_RESPONSES`` keeps working; the
+    registry is created once per process and then cached as a module global.
+    """
+    if name == "MOCK_RESPONSES":
+        global MOCK_RESPONSES
+        MOCK_RESPONSES = create_mock_scraper_responses()
+        return MOCK_RESPONSES
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
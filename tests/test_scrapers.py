@@ -11,7 +11,7 @@ from unittest.mock import patch, MagicMock, PropertyMock
 
 # Import base test utilities
 from tests.base_test import BaseTestCase
-from tests.mock_responses import MOCK_RESPONSES
+from tests.mock_responses import MOCK_RESPONSES, MockResponse
 
 # Import scrapers
 from scrapers.base_scraper import BaseScraper
@@ -364,7 +364,7 @@ class TestPixabayScraper(BaseTestCase):
         best_video = self.scraper._get_best_quality_video(video_files)
         self.assertEqual(best_video, {})
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_download_video(self, mock_get):
         """Test the download_video method."""
         # Setup mock response
@@ -722,30 +722,14 @@ class TestWikimediaScraper(BaseTestCase):
     
     def test_search_videos(self):
         """Test the search_videos method."""
-        # Setup mock response for search
-        mock_search_response = MagicMock()
-        mock_search_response.status_code = 200
-        mock_search_response.json.return_value = {
-            "query": {
-                "search": [
-                    {
-                        "title": "File:Test_Video.webm",
-                        "pageid": 12345,
-                        "snippet": "A test video from Wikimedia Commons"
-                    }
-                ]
-            }
-        }
-        
-        # Setup mock response for file info
-        mock_fileinfo_response = MagicMock()
-        mock_fileinfo_response.status_code = 200
-        mock_fileinfo_response.json.return_value = {
+        # Setup mock response for the search (generator=search returns imageinfo directly)
+        search_payload = {
             "query": {
                 "pages": {
                     "12345": {
                         "pageid": 12345,
                         "title": "File:Test_Video.webm",
+                        "index": 1,
                         "imageinfo": [
                             {
                                 "url": "https://upload.wikimedia.org/wikipedia/commons/test/Test_Video.webm",
@@ -774,8 +758,7 @@ class TestWikimediaScraper(BaseTestCase):
             }
         }
         
-        # Configure mock to return different responses for different calls
-        self.mock_make_request.side_effect = [mock_search_response, mock_fileinfo_response]
+        self.mock_make_request.return_value = MockResponse(json_data=search_payload)
         
         # Test search
         results = self.scraper.search_videos("test")
@@ -1,29 +1,207 @@
 """
 Comprehensive test suite for all video pipeline scrapers.
+
+The test classes share no files or module state, so the module can run under
+pytest-xdist (``python -m pytest -n auto --dist loadfile``).
 """
 
 import os
+import io
+import asyncio
 import unittest
 import tempfile
 import json
-from unittest.mock import patch, MagicMock, mock_open, PropertyMock
+from dataclasses import dataclass
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock, mock_open
 import logging
 import requests
 
-# Configure logging for tests
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Import scrapers
+# Scraper instances log under "scraper.<name>", their modules under "scrapers.<module>"
+_SCRAPER_LOGGERS = ("scraper", "scrapers")
+
+# Import scrapers; each test class resolves its own scraper in setUpClass (see SCRAPER)
 from scrapers.base_scraper import BaseScraper
-from scrapers.pexels_scraper import PexelsScraper
-from scrapers.videvo_scraper import VidevoScraper
-from scrapers.nasa_scraper import NASAScraper
-from scrapers.internet_archive_scraper import InternetArchiveScraper
-from scrapers.wikimedia_scraper import WikimediaScraper
-from scrapers.coverr_scraper import CoverrScraper
-from scrapers.noaa_scraper import NOAAScraper
-from scrapers.pixabay_scraper import PixabayScraper
+from tests.base_test import load_scraper
+from tests.mock_responses import MockResponse, dispatch
+
+
+# Body of the shared download response in tests.mock_responses
+_CHUNK = b"test video content"
+
+
+def _offline_send(adapter, request, **kwargs):
+    """Answer a request that reached the transport with a 404 instead of opening a socket."""
+    response = requests.Response()
+    response.status_code = 404
+    response._content = b""
+    response.url = request.url
+    response.request = request
+    return response
+
+
+def setUpModule():
+    """Serve requests.get from the shared mock registry and quiet the scraper logs."""
+    # Tests that inspect the download request patch requests.get or Session.get themselves
+    requests_patcher = patch('requests.get', side_effect=dispatch)
+    requests_patcher.start()
+    unittest.addModuleCleanup(requests_patcher.stop)
+    
+    # Safety net for Session requests a test forgot to mock: no test reaches the network
+    send_patcher = patch.object(requests.adapters.HTTPAdapter, 'send', _offline_send)
+    send_patcher.start()
+    unittest.addModuleCleanup(send_patcher.stop)
+    
+    # The error paths under test log on purpose; keep them off stderr
+    for name in _SCRAPER_LOGGERS:
+        scraper_logger = logging.getLogger(name)
+        unittest.addModuleCleanup(scraper_logger.setLevel, scraper_logger.level)
+        scraper_logger.setLevel(logging.CRITICAL)
+
+
+def _json_copy(payload):
+    """Return a fresh copy of a fixture payload, built from the types json.loads produces."""
+    return json.loads(json.dumps(payload))
+
+
+def _json_response(payload, status_code=200):
+    """Return a lightweight stand-in for a requests.Response with a JSON body."""
+    body = json.dumps(payload)
+    return SimpleNamespace(status_code=status_code, json=lambda: json.loads(body), raise_for_status=lambda: None)
+
+
+def _mock_make_request(scraper, add_cleanup):
+    """
+    Patch the scraper's _make_request method.
+    
+    Args:
+        scraper: Scraper instance to patch
+        add_cleanup: addCleanup or addClassCleanup of the test, to undo the patch
+        
+    Returns:
+        The MagicMock standing in for _make_request
+    """
+    patcher = patch.object(scraper, '_make_request')
+    mock_make_request = patcher.start()
+    add_cleanup(patcher.stop)
+    return mock_make_request
+
+
+# Canned API payloads; tests hand the scrapers fresh decoded copies, never these objects
+PEXELS_VIDEO_FIXTURE = {
+    "id": 1234,
+    "url": "https://www.pexels.com/video/test-video-1234/",
+    "image": "https://example.com/thumbnail.jpg",
+    "duration": 10,
+    "user": {"name": "Test User"},
+    "video_files": [
+        {
+            "link": "https://example.com/video.mp4",
+            "width": 1920,
+            "height": 1080,
+            "fps": 30,
+            "file_type": "video/mp4"
+        }
+    ]
+}
+
+# The search endpoint wraps the same video object in a list
+PEXELS_SEARCH_FIXTURE = {"videos": [PEXELS_VIDEO_FIXTURE]}
+
+PIXABAY_HIT_FIXTURE = {
+    "id": 1234,
+    "pageURL": "https://pixabay.com/videos/test-video-1234/",
+    "tags": "nature,landscape,mountains",
+    "duration": 10,
+    "user": "TestUser",
+    "userImageURL": "https://example.com/user.jpg",
+    "videos": {
+        "large": {
+            "url": "https://example.com/video_large.mp4",
+            "width": 1920,
+            "height": 1080,
+            "size": 12345
+        },
+        "medium": {
+            "url": "https://example.com/video_medium.mp4",
+            "width": 1280,
+            "height": 720,
+            "size": 6789
+        }
+    }
+}
+
+# Searches and id lookups go to the same endpoint and return the same hits
+PIXABAY_SEARCH_FIXTURE = {"totalHits": 1, "hits": [PIXABAY_HIT_FIXTURE]}
+PIXABAY_METADATA_FIXTURE = {"hits": [PIXABAY_HIT_FIXTURE]}
+
+VIDEVO_SEARCH_FIXTURE = {
+    "results": [
+        {
+            "_source": {
+                "id": "1234",
+                "title": "Test Video",
+                "description": "A test video description",
+                "details_page": "https://www.videvo.net/video/test-video/1234/",
+                "thumbnail": "https://example.com/thumbnail.jpg",
+                "small_preview_mp4": "https://example.com/video.mp4",
+                "frame": "1920x1080",
+                "duration": "00:10",
+                "codec": "mp4",
+                "author": "Test User",
+                "license": "Free",
+                "keywords": "nature,landscape",
+                "date_published": "2023-01-01",
+                "is_editorial": 0,
+                "is_premium": 0,
+                "is_sensitive": False
+            }
+        }
+    ]
+}
+
+NASA_SEARCH_FIXTURE = {
+    "collection": {
+        "items": [
+            {
+                "href": "https://images-assets.nasa.gov/video/test-video/collection.json",
+                "data": [
+                    {
+                        "nasa_id": "test-video",
+                        "title": "Test NASA Video",
+                        "description": "A test NASA video",
+                        "media_type": "video",
+                        "date_created": "2023-01-01T00:00:00Z",
+                        "keywords": ["space", "test"]
+                    }
+                ],
+                "links": [
+                    {
+                        "href": "https://example.com/thumbnail.jpg",
+                        "rel": "preview",
+                        "render": "image"
+                    }
+                ]
+            }
+        ]
+    }
+}
+
+IA_METADATA_FIXTURE = {
+    'identifier': 'test-video',
+    'title': 'Test Internet Archive Video',
+    'description': 'A test video from Internet Archive',
+    'mediatype': 'movies',
+    'format': ['h.264', 'mp4'],
+    'creator': 'Test Creator',
+    'subject': ['test', 'archive'],
+    'downloads': 100,
+    'item_size': 12345678,
+    'publicdate': '2023-01-01T00:00:00Z'
+}
+
 
 class TestBaseScraper(unittest.TestCase):
     """Test cases for the base scraper class."""
@@ -41,33 +219,48 @@ class TestBaseScraper(unittest.TestCase):
         self.assertEqual(self.scraper.name, "base")
         self.assertIsNotNone(self.scraper.logger)
     
-    @patch('requests.Session.get')
-    def test_make_request(self, mock_get):
+    def test_make_request(self):
         """Test the _make_request method."""
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
-        
-        # Test successful request
-        response = self.scraper._make_request("https://example.com")
-        self.assertEqual(response, mock_response)
-        mock_get.assert_called_once()
-        
-        # Test failed request
-        mock_get.reset_mock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("404 Client Error")
-        response = self.scraper._make_request("https://example.com")
-        self.assertIsNone(response)
-        mock_get.assert_called_once()
-        
-        # Test exception handling
-        mock_get.reset_mock()
-        mock_get.side_effect = Exception("Test exception")
-        response = self.scraper._make_request("https://example.com")
-        self.assertIsNone(response)
-        mock_get.assert_called_once()
+        http_error = requests.exceptions.HTTPError("404 Client Error")
+        scenarios = [
+            # (name, status code, raise_for_status error, Session.get error, expect None)
+            ("success", 200, None, None, False),
+            ("failed_request", 404, http_error, None, True),
+            ("exception", 200, None, Exception("Test exception"), True)
+        ]
+        for name, status_code, status_error, get_error, expect_none in scenarios:
+            with self.subTest(name), patch('requests.Session.get', side_effect=get_error) as mock_get:
+                mock_get.return_value.status_code = status_code
+                mock_get.return_value.raise_for_status.side_effect = status_error
+                
+                response = self.scraper._make_request("https://example.com")
+                
+                if expect_none:
+                    self.assertIsNone(response)
+                else:
+                    self.assertEqual(response, mock_get.return_value)
+                mock_get.assert_called_once()
+
+    def test_unmocked_request_stays_offline(self):
+        """Test that a request no test mocked is answered without the network."""
+        self.assertIsNone(self.scraper._make_request("https://example.com"))
+        self.assertEqual(self.scraper.session.get("https://example.com").status_code, 404)
+
+    def test_download_videos_batch(self):
+        """Test the download_videos_batch method."""
+        items = [("https://example.com/a.mp4", "a.mp4"), ("https://example.com/b.mp4", "b.mp4")]
+        with patch.object(self.scraper, 'download_video', side_effect=lambda url, path: path == "a.mp4") as mock_download:
+            results = self.scraper.download_videos_batch(items)
+
+        # Results keep input order
+        self.assertEqual(results, [True, False])
+        self.assertEqual(mock_download.call_count, 2)
+        self.assertEqual(self.scraper.download_videos_batch([]), [])
+
+    def test_split_tags(self):
+        """Test that tag strings are split on commas with surrounding whitespace and blanks dropped."""
+        self.assertEqual(BaseScraper._split_tags(" nature, forest ,,river "), ["nature", "forest", "river"])
+        self.assertEqual(BaseScraper._split_tags(""), [])
 
 
 # Create a dummy concrete subclass that implements abstract methods with NotImplementedError
@@ -111,27 +304,30 @@ class TestBaseScraperAbstractMethods(unittest.TestCase):
 class TestPexelsScraper(unittest.TestCase):
     """Test cases for the Pexels scraper."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.config = {
+    SCRAPER = "scrapers.pexels_scraper:PexelsScraper"
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build the scraper once for the class."""
+        cls.config = {
             "base_url": "https://api.pexels.com/videos/",
             "per_page": 10
         }
         
         # Mock environment variable
-        self.env_patcher = patch.dict('os.environ', {'PEXELS_API_KEY': 'test_key'})
-        self.env_patcher.start()
+        env_patcher = patch.dict('os.environ', {'PEXELS_API_KEY': 'test_key'})
+        env_patcher.start()
+        cls.addClassCleanup(env_patcher.stop)
         
-        self.scraper = PexelsScraper(self.config)
+        cls.scraper_class = load_scraper(cls.SCRAPER)
+        cls.scraper = cls.scraper_class(cls.config)
         
         # Mock the _make_request method
-        self.make_request_patcher = patch.object(self.scraper, '_make_request')
-        self.mock_make_request = self.make_request_patcher.start()
+        cls.mock_make_request = _mock_make_request(cls.scraper, cls.addClassCleanup)
     
-    def tearDown(self):
-        """Clean up after tests."""
-        self.make_request_patcher.stop()
-        self.env_patcher.stop()
+    def setUp(self):
+        """Give each test a fresh _make_request mock."""
+        self.mock_make_request.reset_mock(return_value=True, side_effect=True)
     
     def test_initialization(self):
         """Test scraper initialization."""
@@ -143,29 +339,7 @@ class TestPexelsScraper(unittest.TestCase):
     def test_search_videos(self):
         """Test the search_videos method."""
         # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "videos": [
-                {
-                    "id": 1234,
-                    "url": "https://www.pexels.com/video/test-video-1234/",
-                    "image": "https://example.com/thumbnail.jpg",
-                    "duration": 10,
-                    "user": {"name": "Test User"},
-                    "video_files": [
-                        {
-                            "link": "https://example.com/video.mp4",
-                            "width": 1920,
-                            "height": 1080,
-                            "fps": 30,
-                            "file_type": "video/mp4"
-                        }
-                    ]
-                }
-            ]
-        }
-        self.mock_make_request.return_value = mock_response
+        self.mock_make_request.return_value = _json_response(PEXELS_SEARCH_FIXTURE)
         
         # Test search
         results = self.scraper.search_videos("nature")
@@ -181,25 +355,7 @@ class TestPexelsScraper(unittest.TestCase):
     def test_get_video_metadata(self):
         """Test the get_video_metadata method."""
         # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": 1234,
-            "url": "https://www.pexels.com/video/test-video-1234/",
-            "image": "https://example.com/thumbnail.jpg",
-            "duration": 10,
-            "user": {"name": "Test User"},
-            "video_files": [
-                {
-                    "link": "https://example.com/video.mp4",
-                    "width": 1920,
-                    "height": 1080,
-                    "fps": 30,
-                    "file_type": "video/mp4"
-                }
-            ]
-        }
-        self.mock_make_request.return_value = mock_response
+        self.mock_make_request.return_value = _json_response(PEXELS_VIDEO_FIXTURE)
         
         # Test get metadata
         metadata = self.scraper.get_video_metadata("1234")
@@ -211,37 +367,25 @@ class TestPexelsScraper(unittest.TestCase):
         self.assertEqual(metadata["width"], 1920)
         self.assertEqual(metadata["height"], 1080)
     
-    @patch('requests.get')
-    def test_download_video(self, mock_get):
+    def test_download_video(self):
         """Test the download_video method."""
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.iter_content.return_value = [b"test data"]
-        mock_get.return_value = mock_response
-        
-        # Create temporary file for download
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_path = temp_file.name
-        
-        try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = os.path.join(temp_dir, "video.mp4")
+            
             # Test download
             result = self.scraper.download_video("https://example.com/video.mp4", temp_path)
             
             # Verify result
             self.assertTrue(result)
             self.assertTrue(os.path.exists(temp_path))
-            
-        finally:
-            # Clean up
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+            with open(temp_path, "rb") as f:
+                self.assertEqual(f.read(), _CHUNK)
     
     def test_missing_api_key(self):
         """Test behavior when API key is missing."""
         # Remove API key from environment
         with patch.dict('os.environ', {}, clear=True):
-            scraper = PexelsScraper(self.config)
+            scraper = self.scraper_class(self.config)
             
             # Test search with missing API key
             results = scraper.search_videos("nature")
@@ -255,28 +399,31 @@ class TestPexelsScraper(unittest.TestCase):
 class TestPixabayScraper(unittest.TestCase):
     """Test cases for the Pixabay scraper."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.config = {
+    SCRAPER = "scrapers.pixabay_scraper:PixabayScraper"
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build the scraper once for the class."""
+        cls.config = {
             "base_url": "https://pixabay.com/api/videos/",
             "per_page": 10,
             "request_delay": 0.01  # Fast for testing
         }
         
         # Mock environment variable
-        self.env_patcher = patch.dict('os.environ', {'PIXABAY_API_KEY': 'test_key'})
-        self.env_patcher.start()
+        env_patcher = patch.dict('os.environ', {'PIXABAY_API_KEY': 'test_key'})
+        env_patcher.start()
+        cls.addClassCleanup(env_patcher.stop)
         
-        self.scraper = PixabayScraper(self.config)
+        cls.scraper_class = load_scraper(cls.SCRAPER)
+        cls.scraper = cls.scraper_class(cls.config)
         
         # Mock the _make_request method
-        self.make_request_patcher = patch.object(self.scraper, '_make_request')
-        self.mock_make_request = self.make_request_patcher.start()
+        cls.mock_make_request = _mock_make_request(cls.scraper, cls.addClassCleanup)
     
-    def tearDown(self):
-        """Clean up after tests."""
-        self.make_request_patcher.stop()
-        self.env_patcher.stop()
+    def setUp(self):
+        """Give each test a fresh _make_request mock."""
+        self.mock_make_request.reset_mock(return_value=True, side_effect=True)
     
     def test_initialization(self):
         """Test scraper initialization."""
@@ -288,36 +435,7 @@ class TestPixabayScraper(unittest.TestCase):
     def test_search_videos(self):
         """Test the search_videos method."""
         # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "totalHits": 1,
-            "hits": [
-                {
-                    "id": 1234,
-                    "pageURL": "https://pixabay.com/videos/test-video-1234/",
-                    "tags": "nature,landscape,mountains",
-                    "duration": 10,
-                    "user": "TestUser",
-                    "userImageURL": "https://example.com/user.jpg",
-                    "videos": {
-                        "large": {
-                            "url": "https://example.com/video_large.mp4",
-                            "width": 1920,
-                            "height": 1080,
-                            "size": 12345
-                        },
-                        "medium": {
-                            "url": "https://example.com/video_medium.mp4",
-                            "width": 1280,
-                            "height": 720,
-                            "size": 6789
-                        }
-                    }
-                }
-            ]
-        }
-        self.mock_make_request.return_value = mock_response
+        self.mock_make_request.return_value = _json_response(PIXABAY_SEARCH_FIXTURE)
         
         # Test search
         results = self.scraper.search_videos("nature")
@@ -331,33 +449,12 @@ class TestPixabayScraper(unittest.TestCase):
         self.assertEqual(results[0]["height"], 1080)
         self.assertEqual(results[0]["title"], "nature landscape mountains")
         self.assertEqual(results[0]["user"], "TestUser")
+        self.assertEqual(results[0]["tags"], ["nature", "landscape", "mountains"])
     
     def test_get_video_metadata(self):
         """Test the get_video_metadata method."""
         # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "hits": [
-                {
-                    "id": 1234,
-                    "pageURL": "https://pixabay.com/videos/test-video-1234/",
-                    "tags": "nature,landscape,mountains",
-                    "duration": 10,
-                    "user": "TestUser",
-                    "userImageURL": "https://example.com/user.jpg",
-                    "videos": {
-                        "large": {
-                            "url": "https://example.com/video_large.mp4",
-                            "width": 1920,
-                            "height": 1080,
-                            "size": 12345
-                        }
-                    }
-                }
-            ]
-        }
-        self.mock_make_request.return_value = mock_response
+        self.mock_make_request.return_value = _json_response(PIXABAY_METADATA_FIXTURE)
         
         # Test get metadata
         metadata = self.scraper.get_video_metadata("1234")
@@ -369,69 +466,94 @@ class TestPixabayScraper(unittest.TestCase):
         self.assertEqual(metadata["width"], 1920)
         self.assertEqual(metadata["height"], 1080)
     
+    def test_search_pages(self):
+        """Test fetching several pages concurrently with search_pages."""
+        def page_response(url, params=None):
+            return _json_response({
+                "hits": [
+                    {
+                        "id": params["page"],
+                        "tags": "nature",
+                        "user": "TestUser",
+                        "videos": {
+                            "large": {"url": f"https://example.com/{params['page']}.mp4", "width": 1920, "height": 1080}
+                        }
+                    }
+                ]
+            })
+        self.mock_make_request.side_effect = page_response
+        
+        # Test search across pages
+        results = self.scraper.search_pages("nature", [1, 2, 3])
+        
+        # Verify results come back in page order
+        self.assertEqual(len(results), 3)
+        self.assertEqual([page[0]["id"] for page in results], ["1", "2", "3"])
+        self.assertEqual(self.mock_make_request.call_count, 3)
+        
+        # Called from a running event loop, it falls back to a thread pool instead of asyncio.run
+        async def search_in_loop():
+            return self.scraper.search_pages("nature", [1, 2])
+        results = asyncio.run(search_in_loop())
+        self.assertEqual([page[0]["id"] for page in results], ["1", "2"])
+        
+        # Async callers can await the pages directly
+        results = asyncio.run(self.scraper.search_pages_async("nature", [3]))
+        self.assertEqual(results[0][0]["id"], "3")
+
     def test_get_best_quality_video(self):
         """Test the _get_best_quality_video method."""
-        # Test with all formats available
-        video_files = {
-            "large": {"url": "large.mp4", "width": 1920, "height": 1080},
-            "medium": {"url": "medium.mp4", "width": 1280, "height": 720},
-            "small": {"url": "small.mp4", "width": 640, "height": 360},
-            "tiny": {"url": "tiny.mp4", "width": 320, "height": 180}
-        }
-        best_video = self.scraper._get_best_quality_video(video_files)
-        self.assertEqual(best_video["url"], "large.mp4")
-        
-        # Test with only medium format
-        video_files = {
-            "medium": {"url": "medium.mp4", "width": 1280, "height": 720},
-            "small": {"url": "small.mp4", "width": 640, "height": 360}
-        }
-        best_video = self.scraper._get_best_quality_video(video_files)
-        self.assertEqual(best_video["url"], "medium.mp4")
-        
-        # Test with only small format
-        video_files = {
-            "small": {"url": "small.mp4", "width": 640, "height": 360}
-        }
-        best_video = self.scraper._get_best_quality_video(video_files)
-        self.assertEqual(best_video["url"], "small.mp4")
-        
-        # Test with no formats
-        video_files = {}
-        best_video = self.scraper._get_best_quality_video(video_files)
-        self.assertEqual(best_video, {})
+        cases = [
+            # All formats available
+            ({
+                "large": {"url": "large.mp4", "width": 1920, "height": 1080},
+                "medium": {"url": "medium.mp4", "width": 1280, "height": 720},
+                "small": {"url": "small.mp4", "width": 640, "height": 360},
+                "tiny": {"url": "tiny.mp4", "width": 320, "height": 180}
+            }, "large.mp4"),
+            # Only medium and small formats
+            ({
+                "medium": {"url": "medium.mp4", "width": 1280, "height": 720},
+                "small": {"url": "small.mp4", "width": 640, "height": 360}
+            }, "medium.mp4"),
+            # Only small format
+            ({
+                "small": {"url": "small.mp4", "width": 640, "height": 360}
+            }, "small.mp4"),
+            # No formats
+            ({}, None)
+        ]
+        for video_files, expected_url in cases:
+            with self.subTest(formats=list(video_files)):
+                best_video = self.scraper._get_best_quality_video(video_files)
+                if expected_url is None:
+                    self.assertEqual(best_video, {})
+                else:
+                    self.assertEqual(best_video["url"], expected_url)
     
-    @patch('requests.get')
+    @patch('requests.Session.get', side_effect=dispatch)
     def test_download_video(self, mock_get):
         """Test the download_video method."""
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.iter_content.return_value = [b"test video content"]
-        mock_get.return_value = mock_response
-        
-        # Create temporary file for download
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_path = temp_file.name
-        
-        try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = os.path.join(temp_dir, "video.mp4")
+            
             # Test download
             result = self.scraper.download_video("https://example.com/video.mp4", temp_path)
             
             # Verify result
             self.assertTrue(result)
             self.assertTrue(os.path.exists(temp_path))
-            
-        finally:
-            # Clean up
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+            with open(temp_path, "rb") as f:
+                self.assertEqual(f.read(), _CHUNK)
+        
+        # Downloads reuse the scraper's pooled session
+        mock_get.assert_called_once()
     
     def test_missing_api_key(self):
         """Test behavior when API key is missing."""
         # Remove API key from environment
         with patch.dict('os.environ', {}, clear=True):
-            scraper = PixabayScraper(self.config)
+            scraper = self.scraper_class(self.config)
             
             # Test search with missing API key
             results = scraper.search_videos("nature")
@@ -440,33 +562,78 @@ class TestPixabayScraper(unittest.TestCase):
             # Test get metadata with missing API key
             metadata = scraper.get_video_metadata("1234")
             self.assertEqual(metadata, {})
+    
+    @patch('requests.Session.get')
+    def test_download_video_atomic(self, mock_get):
+        """Test that downloads are renamed into place and finished files are skipped."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [b"test video content"]
+        mock_get.return_value = mock_response
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "video.mp4")
+            
+            # Fresh download leaves no partial file behind
+            self.assertTrue(self.scraper.download_video("https://example.com/video.mp4", output_path))
+            self.assertFalse(os.path.exists(output_path + ".part"))
+            with open(output_path, "rb") as f:
+                self.assertEqual(f.read(), b"test video content")
+            
+            # A completed download is not fetched again
+            mock_get.reset_mock()
+            self.assertTrue(self.scraper.download_video("https://example.com/video.mp4", output_path))
+            mock_get.assert_not_called()
+    
+    @patch('requests.Session.get')
+    def test_download_video_resume(self, mock_get):
+        """Test that a leftover .part file is resumed with a Range request."""
+        mock_response = MagicMock()
+        mock_response.status_code = 206
+        mock_response.iter_content.return_value = [b"content"]
+        mock_get.return_value = mock_response
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "video.mp4")
+            with open(output_path + ".part", "wb") as f:
+                f.write(b"test video ")
+            
+            self.assertTrue(self.scraper.download_video("https://example.com/video.mp4", output_path))
+            
+            # Only the missing bytes were requested and appended
+            self.assertEqual(mock_get.call_args[1]["headers"], {"Range": "bytes=11-"})
+            with open(output_path, "rb") as f:
+                self.assertEqual(f.read(), b"test video content")
 
 
 class TestVidevoScraper(unittest.TestCase):
     """Test cases for the Videvo scraper."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.config = {
+    SCRAPER = "scrapers.videvo_scraper:VidevoScraper"
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build the scraper once for the class."""
+        cls.config = {
             "base_url": "https://www.videvo.net/api/videos/",
             "per_page": 10,
             "request_delay": 0.01  # Fast for testing
         }
         
         # Mock environment variable
-        self.env_patcher = patch.dict('os.environ', {'VIDEVO_API_KEY': 'test_key'})
-        self.env_patcher.start()
+        env_patcher = patch.dict('os.environ', {'VIDEVO_API_KEY': 'test_key'})
+        env_patcher.start()
+        cls.addClassCleanup(env_patcher.stop)
         
-        self.scraper = VidevoScraper(self.config)
+        cls.scraper_class = load_scraper(cls.SCRAPER)
+        cls.scraper = cls.scraper_class(cls.config)
         
         # Mock the _make_request method
-        self.make_request_patcher = patch.object(self.scraper, '_make_request')
-        self.mock_make_request = self.make_request_patcher.start()
+        cls.mock_make_request = _mock_make_request(cls.scraper, cls.addClassCleanup)
     
-    def tearDown(self):
-        """Clean up after tests."""
-        self.make_request_patcher.stop()
-        self.env_patcher.stop()
+    def setUp(self):
+        """Give each test a fresh _make_request mock."""
+        self.mock_make_request.reset_mock(return_value=True, side_effect=True)
     
     def test_initialization(self):
         """Test scraper initialization."""
@@ -478,33 +645,7 @@ class TestVidevoScraper(unittest.TestCase):
     def test_search_videos(self):
         """Test the search_videos method."""
         # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "results": [
-                {
-                    "_source": {
-                        "id": "1234",
-                        "title": "Test Video",
-                        "description": "A test video description",
-                        "details_page": "https://www.videvo.net/video/test-video/1234/",
-                        "thumbnail": "https://example.com/thumbnail.jpg",
-                        "small_preview_mp4": "https://example.com/video.mp4",
-                        "frame": "1920x1080",
-                        "duration": "00:10",
-                        "codec": "mp4",
-                        "author": "Test User",
-                        "license": "Free",
-                        "keywords": "nature,landscape",
-                        "date_published": "2023-01-01",
-                        "is_editorial": 0,
-                        "is_premium": 0,
-                        "is_sensitive": False
-                    }
-                }
-            ]
-        }
-        self.mock_make_request.return_value = mock_response
+        self.mock_make_request.return_value = _json_response(VIDEVO_SEARCH_FIXTURE)
         
         # Test search
         results = self.scraper.search_videos("nature")
@@ -522,7 +663,7 @@ class TestVidevoScraper(unittest.TestCase):
         """Test behavior when API key is missing."""
         # Remove API key from environment
         with patch.dict('os.environ', {}, clear=True):
-            scraper = VidevoScraper(self.config)
+            scraper = self.scraper_class(self.config)
             
             # Mock the _make_request method to return None
             with patch.object(scraper, '_make_request', return_value=None):
@@ -534,34 +675,38 @@ class TestVidevoScraper(unittest.TestCase):
 class TestNASAScraper(unittest.TestCase):
     """Test cases for the NASA scraper."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.config = {
+    SCRAPER = "scrapers.nasa_scraper:NASAScraper"
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build the scraper once for the class."""
+        cls.config = {
             "search_url": "https://images-api.nasa.gov/search",
             "per_page": 10,
             "request_delay": 0.01  # Fast for testing
         }
         
         # Mock environment variable
-        self.env_patcher = patch.dict('os.environ', {'NASA_API_KEY': 'test_key'})
-        self.env_patcher.start()
+        env_patcher = patch.dict('os.environ', {'NASA_API_KEY': 'test_key'})
+        env_patcher.start()
+        cls.addClassCleanup(env_patcher.stop)
         
-        self.scraper = NASAScraper(self.config)
+        cls.scraper_class = load_scraper(cls.SCRAPER)
+        cls.scraper = cls.scraper_class(cls.config)
         
         # Mock the _make_request method
-        self.make_request_patcher = patch.object(self.scraper, '_make_request')
-        self.mock_make_request = self.make_request_patcher.start()
+        cls.mock_make_request = _mock_make_request(cls.scraper, cls.addClassCleanup)
         
         # Mock the _get_asset_info method
-        self.get_asset_info_patcher = patch.object(self.scraper, '_get_asset_info')
-        self.mock_get_asset_info = self.get_asset_info_patcher.start()
-        self.mock_get_asset_info.return_value = {"url": "https://example.com/video.mp4"}
+        get_asset_info_patcher = patch.object(cls.scraper, '_get_asset_info')
+        cls.mock_get_asset_info = get_asset_info_patcher.start()
+        cls.addClassCleanup(get_asset_info_patcher.stop)
     
-    def tearDown(self):
-        """Clean up after tests."""
-        self.make_request_patcher.stop()
-        self.get_asset_info_patcher.stop()
-        self.env_patcher.stop()
+    def setUp(self):
+        """Give each test fresh request mocks."""
+        self.mock_make_request.reset_mock(return_value=True, side_effect=True)
+        self.mock_get_asset_info.reset_mock(side_effect=True)
+        self.mock_get_asset_info.return_value = {"url": "https://example.com/video.mp4"}
     
     def test_initialization(self):
         """Test scraper initialization."""
@@ -573,36 +718,7 @@ class TestNASAScraper(unittest.TestCase):
     def test_search_videos(self):
         """Test the search_videos method."""
         # Setup mock response for search
-        mock_search_response = MagicMock()
-        mock_search_response.status_code = 200
-        mock_search_response.json.return_value = {
-            "collection": {
-                "items": [
-                    {
-                        "href": "https://images-assets.nasa.gov/video/test-video/collection.json",
-                        "data": [
-                            {
-                                "nasa_id": "test-video",
-                                "title": "Test NASA Video",
-                                "description": "A test NASA video",
-                                "media_type": "video",
-                                "date_created": "2023-01-01T00:00:00Z",
-                                "keywords": ["space", "test"]
-                            }
-                        ],
-                        "links": [
-                            {
-                                "href": "https://example.com/thumbnail.jpg",
-                                "rel": "preview",
-                                "render": "image"
-                            }
-                        ]
-                    }
-                ]
-            }
-        }
-        
-        self.mock_make_request.return_value = mock_search_response
+        self.mock_make_request.return_value = _json_response(NASA_SEARCH_FIXTURE)
         
         # Test search
         results = self.scraper.search_videos("space")
@@ -615,29 +731,51 @@ class TestNASAScraper(unittest.TestCase):
         self.assertEqual(results[0]["url"], "https://example.com/video.mp4")
 
 
+# Plain stand-ins for internetarchive's File and Item objects
+@dataclass
+class FakeIAFile:
+    """Stub of an internetarchive file with the attributes the scraper reads."""
+    
+    name: str
+    format: str
+    size: int
+    source: str
+    width: int
+    height: int
+
+
+@dataclass
+class FakeIAItem:
+    """Stub of an internetarchive item."""
+    
+    identifier: str
+    metadata: dict
+    files: dict
+
+
 class TestInternetArchiveScraper(unittest.TestCase):
     """Test cases for the Internet Archive scraper."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.config = {
+    SCRAPER = "scrapers.internet_archive_scraper:InternetArchiveScraper"
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build the scraper once for the class."""
+        cls.config = {
             "per_page": 10,
             "request_delay": 0.01  # Fast for testing
         }
         
         # Mock environment variables
-        self.env_patcher = patch.dict('os.environ', {
+        env_patcher = patch.dict('os.environ', {
             'IA_ACCESS_KEY': 'test_access_key',
             'IA_SECRET_KEY': 'test_secret_key'
         })
-        self.env_patcher.start()
+        env_patcher.start()
+        cls.addClassCleanup(env_patcher.stop)
         
-        # Create the scraper with mocked methods
-        self.scraper = InternetArchiveScraper(self.config)
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        self.env_patcher.stop()
+        cls.scraper_class = load_scraper(cls.SCRAPER)
+        cls.scraper = cls.scraper_class(cls.config)
     
     def test_initialization(self):
         """Test scraper initialization."""
@@ -650,51 +788,12 @@ class TestInternetArchiveScraper(unittest.TestCase):
     @patch('scrapers.internet_archive_scraper.get_item')
     def test_search_videos(self, mock_get_item, mock_search_items):
         """Test the search_videos method."""
-        # Create a mock search result item
-        mock_search_result = MagicMock()
-        
-        # Set up the metadata dictionary
-        mock_metadata = {
-            'identifier': 'test-video',
-            'title': 'Test Internet Archive Video',
-            'description': 'A test video from Internet Archive',
-            'mediatype': 'movies',
-            'format': ['h.264', 'mp4'],
-            'creator': 'Test Creator',
-            'subject': ['test', 'archive'],
-            'downloads': 100,
-            'item_size': 12345678,
-            'publicdate': '2023-01-01T00:00:00Z'
-        }
-        
-        # Configure the mock search result to return metadata values
-        mock_search_result.get.side_effect = lambda key, default=None: mock_metadata.get(key, default)
-        
-        # Return the mock search result in the search results - only return one result
-        mock_search_items.return_value = [mock_search_result]
-        
-        # Create a mock item details object
-        mock_item_details = MagicMock()
-        mock_item_details.identifier = 'test-video'
-        mock_item_details.metadata = mock_metadata
-        
-        # Create a mock file object
-        mock_file = MagicMock()
-        mock_file.name = 'test_video.mp4'
-        mock_file.format = 'h.264'
-        mock_file.size = 12345678
-        mock_file.source = 'original'
-        mock_file.width = 1920
-        mock_file.height = 1080
-        
-        # Create a mock files dictionary
-        mock_files = {'test_video.mp4': mock_file}
-        
-        # Set the files property on the mock item details
-        type(mock_item_details).files = PropertyMock(return_value=mock_files)
+        # Search results are plain metadata dicts - only return one result
+        mock_search_items.return_value = [_json_copy(IA_METADATA_FIXTURE)]
         
-        # Configure get_item to return the mock item details
-        mock_get_item.return_value = mock_item_details
+        # Configure get_item to return a stub item with a single video file
+        mock_file = FakeIAFile('test_video.mp4', 'h.264', 12345678, 'original', 1920, 1080)
+        mock_get_item.return_value = FakeIAItem('test-video', _json_copy(IA_METADATA_FIXTURE), {'test_video.mp4': mock_file})
         
         # Mock the _get_item_metadata method to return a valid result
         with patch.object(self.scraper, '_get_item_metadata') as mock_get_item_metadata:
@@ -734,25 +833,33 @@ class TestInternetArchiveScraper(unittest.TestCase):
 class TestWikimediaScraper(unittest.TestCase):
     """Test cases for the Wikimedia Commons scraper."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.config = {
+    SCRAPER = "scrapers.wikimedia_scraper:WikimediaScraper"
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build the scraper once for the class."""
+        cls.config = {
             "search_url": "https://commons.wikimedia.org/w/api.php",
             "file_url": "https://commons.wikimedia.org/w/api.php",
             "per_page": 10,
             "request_delay": 0.01  # Fast for testing
         }
         
-        # Create the scraper with mocked methods
-        self.scraper = WikimediaScraper(self.config)
+        cls.scraper_class = load_scraper(cls.SCRAPER)
+        cls.scraper = cls.scraper_class(cls.config)
         
         # Mock the _make_request method
-        self.make_request_patcher = patch.object(self.scraper, '_make_request')
-        self.mock_make_request = self.make_request_patcher.start()
+        cls.mock_make_request = _mock_make_request(cls.scraper, cls.addClassCleanup)
     
-    def tearDown(self):
-        """Clean up after tests."""
-        self.make_request_patcher.stop()
+    def setUp(self):
+        """Give each test a fresh _make_request mock and empty caches."""
+        self.mock_make_request.reset_mock(return_value=True, side_effect=True)
+        
+        # The rate limiter and metadata caches are mutated by individual tests
+        self.scraper._meta_cache.clear()
+        self.scraper._negative_cache.clear()
+        self.scraper.min_delay = self.scraper.config.get("min_delay", 0.1)
+        self.scraper._current_delay = self.scraper.request_delay
     
     def test_initialization(self):
         """Test scraper initialization."""
@@ -760,33 +867,22 @@ class TestWikimediaScraper(unittest.TestCase):
         self.assertEqual(self.scraper.search_url, self.config["search_url"])
         self.assertEqual(self.scraper.file_url, self.config["file_url"])
         self.assertEqual(self.scraper.per_page, self.config["per_page"])
+        
+        # Pooled adapter with retries is mounted on the shared session
+        adapter = self.scraper.session.get_adapter("https://commons.wikimedia.org")
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
     
     def test_search_videos(self):
         """Test the search_videos method."""
-        # Setup mock response for search
-        mock_search_response = MagicMock()
-        mock_search_response.status_code = 200
-        mock_search_response.json.return_value = {
-            "query": {
-                "search": [
-                    {
-                        "title": "File:Test_Video.webm",
-                        "pageid": 12345,
-                        "snippet": "A test video from Wikimedia Commons"
-                    }
-                ]
-            }
-        }
-        
-        # Setup mock response for file info
-        mock_fileinfo_response = MagicMock()
-        mock_fileinfo_response.status_code = 200
-        mock_fileinfo_response.json.return_value = {
+        # Setup mock response for the search (generator=search returns imageinfo directly)
+        search_payload = {
             "query": {
                 "pages": {
                     "12345": {
                         "pageid": 12345,
                         "title": "File:Test_Video.webm",
+                        "index": 1,
                         "imageinfo": [
                             {
                                 "url": "https://upload.wikimedia.org/wikipedia/commons/test/Test_Video.webm",
@@ -815,8 +911,7 @@ class TestWikimediaScraper(unittest.TestCase):
             }
         }
         
-        # Configure mock to return different responses for different calls
-        self.mock_make_request.side_effect = [mock_search_response, mock_fileinfo_response]
+        self.mock_make_request.return_value = MockResponse(json_data=search_payload)
         
         # Test search
         results = self.scraper.search_videos("test")
@@ -829,11 +924,173 @@ class TestWikimediaScraper(unittest.TestCase):
         self.assertEqual(results[0]["url"], "https://upload.wikimedia.org/wikipedia/commons/test/Test_Video.webm")
         self.assertEqual(results[0]["width"], 1920)
         self.assertEqual(results[0]["height"], 1080)
+        
+        self.assertEqual(results[0]["description"], "A test video from Wikimedia Commons")
+        
+        # Search and imageinfo come from one request, and the metadata is cached for later lookups
+        metadata = self.scraper.get_video_metadata("Test_Video.webm")
+        self.assertEqual(metadata["url"], results[0]["url"])
+        self.mock_make_request.assert_called_once()
+        self.assertEqual(self.mock_make_request.call_args[1]["params"]["generator"], "search")
+        self.assertIn("filew:>511 fileh:>511", self.mock_make_request.call_args[1]["params"]["gsrsearch"])
+        
+        # Files below the minimum resolution are dropped before their metadata is parsed
+        search_payload["query"]["pages"]["12345"]["imageinfo"][0]["height"] = 360
+        self.mock_make_request.return_value = MockResponse(json_data=search_payload)
+        with patch.object(self.scraper, '_parse_image_info') as mock_parse:
+            self.assertEqual(self.scraper.search_videos("test"), [])
+            mock_parse.assert_not_called()
+    
+    def test_file_metadata_negative_cache(self):
+        """Test that missing files are cached briefly instead of re-queried."""
+        self.mock_make_request.return_value = MockResponse(
+            json_data={"query": {"pages": {"-1": {"title": "File:Missing.webm", "missing": ""}}}}
+        )
+        
+        self.assertEqual(self.scraper._get_file_metadata("Missing.webm"), {})
+        self.assertEqual(self.scraper._get_file_metadata("Missing.webm"), {})
+        self.assertEqual(self.mock_make_request.call_count, 1)
+    
+    def test_parse_image_info(self):
+        """Test extracting duration, license and categories from an imageinfo entry."""
+        metadata = self.scraper._parse_image_info({
+            "mime": "video/webm",
+            "metadata": [{"name": "width", "value": 1920}, {"name": "length", "value": "12.5"}],
+            "extmetadata": {
+                "License": {"value": "cc-by-sa-4.0"},
+                "Categories": {"value": "Test videos| Nature |"}
+            }
+        })
+        self.assertEqual(metadata["duration"], 12.5)
+        self.assertEqual(metadata["license"], "cc-by-sa-4.0")
+        self.assertEqual(metadata["categories"], ["Test videos", "Nature"])
+        self.assertEqual(metadata["format"], "webm")
+        
+        # Non-video files are rejected
+        self.assertEqual(self.scraper._parse_image_info({"mime": "image/png"}), {})
+    
+    def test_parse_json(self):
+        """Test that raw response bodies are decoded without response.json()."""
+        response = MockResponse(content=b'{"query": {"pages": {}}}')
+        with patch.object(MockResponse, 'json') as mock_json:
+            self.assertEqual(self.scraper._parse_json(response), {"query": {"pages": {}}})
+        mock_json.assert_not_called()
+    
+    def test_http2_client(self):
+        """Test that API requests use the HTTP/2 client when enabled, and fall back without httpx."""
+        with patch('scrapers.wikimedia_scraper.httpx', None):
+            scraper = self.scraper_class(dict(self.config, http2=True))
+        self.assertIsNone(scraper._http2_client)
+
+        mock_httpx = MagicMock()
+        with patch('scrapers.wikimedia_scraper.httpx', mock_httpx):
+            scraper = self.scraper_class(dict(self.config, http2=True))
+        mock_client = mock_httpx.Client.return_value
+        self.assertIs(scraper._http2_client, mock_client)
+        self.assertTrue(mock_httpx.Client.call_args[1]["http2"])
+
+        response = scraper._make_request(self.config["search_url"], params={"action": "query"})
+        self.assertIs(response, mock_client.get.return_value)
+        mock_client.get.assert_called_once_with(self.config["search_url"], headers=None, params={"action": "query"})
+
+        scraper.close()
+        mock_client.close.assert_called_once()
+
+    def test_adaptive_rate_limit(self):
+        """Test that the request delay shrinks on success and backs off on 429."""
+        self.scraper.min_delay = 0.005
+        ok_response = MagicMock(status_code=200, headers={})
+        self.scraper._adapt_rate(ok_response)
+        self.assertAlmostEqual(self.scraper._current_delay, 0.009)
+        
+        # Retry-After wins when it asks for more than doubling
+        throttled_response = MagicMock(status_code=429, headers={"Retry-After": "5"})
+        self.scraper._adapt_rate(throttled_response)
+        self.assertEqual(self.scraper._current_delay, 5.0)
+        
+        self.scraper._adapt_rate(MagicMock(status_code=503, headers={}))
+        self.assertEqual(self.scraper._current_delay, 10.0)
+        
+        # Responses pass through the session hook
+        self.assertIn(self.scraper._adapt_rate, self.scraper.session.hooks["response"])
+    
+    def test_download_video(self):
+        """Test that downloads are streamed into place and truncation is detected."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "video.webm")
+            
+            mock_response = MagicMock()
+            mock_response.raw = io.BytesIO(b"test video content")
+            mock_response.headers = {"Content-Length": "18"}
+            with patch.object(self.scraper.session, 'get', return_value=mock_response):
+                self.assertTrue(self.scraper.download_video("https://upload.wikimedia.org/video.webm", output_path))
+            with open(output_path, "rb") as f:
+                self.assertEqual(f.read(), b"test video content")
+            
+            # A short body is rejected and nothing is left at the target path
+            truncated_path = os.path.join(temp_dir, "truncated.webm")
+            mock_response.raw = io.BytesIO(b"test")
+            with patch.object(self.scraper.session, 'get', return_value=mock_response):
+                self.assertFalse(self.scraper.download_video("https://upload.wikimedia.org/video.webm", truncated_path))
+            self.assertFalse(os.path.exists(truncated_path))
+            self.assertFalse(os.path.exists(truncated_path + ".part"))
+    
+    def test_stream_to_cloud(self):
+        """Test piping a download response straight into the uploader."""
+        mock_response = MagicMock()
+        mock_response.raw = io.BytesIO(b"test video content")
+        mock_uploader = MagicMock()
+        mock_uploader.upload_stream.return_value = (True, "https://example.com/videos/clip.webm")
+        
+        with patch.object(self.scraper.session, 'get', return_value=mock_response):
+            result = self.scraper.stream_to_cloud("https://upload.wikimedia.org/clip.webm", mock_uploader, "clip.webm")
+        
+        self.assertEqual(result, (True, "https://example.com/videos/clip.webm"))
+        mock_uploader.upload_stream.assert_called_once_with(mock_response.raw, "clip.webm", None)
+        mock_response.close.assert_called_once()
+    
+    def test_get_video_metadata(self):
+        """Test looking up a file by name, including its description, and caching the result."""
+        payload = {
+            "query": {
+                "normalized": [{"from": "File:Clip_one.webm", "to": "File:Clip one.webm"}],
+                "pages": {
+                    "1": {
+                        "title": "File:Clip one.webm",
+                        "imageinfo": [{
+                            "url": "https://upload.wikimedia.org/a.webm",
+                            "mime": "video/webm",
+                            "width": 1280,
+                            "height": 720,
+                            "extmetadata": {"ImageDescription": {"value": "A clip"}}
+                        }]
+                    }
+                }
+            }
+        }
+        self.mock_make_request.return_value = MockResponse(json_data=payload)
+        
+        metadata = self.scraper.get_video_metadata("Clip_one.webm")
+        
+        self.assertEqual(metadata["url"], "https://upload.wikimedia.org/a.webm")
+        self.assertEqual(metadata["description"], "A clip")
+        self.assertEqual(self.mock_make_request.call_args[1]["params"]["titles"], "File:Clip_one.webm")
+        
+        # A second lookup is served from the cache
+        self.assertEqual(self.scraper.get_video_metadata("Clip_one.webm"), metadata)
+        self.mock_make_request.assert_called_once()
 
 
 class TestCoverrScraper(unittest.TestCase):
     """Test cases for the Coverr scraper."""
     
+    SCRAPER = "scrapers.coverr_scraper:CoverrScraper"
+    
+    @classmethod
+    def setUpClass(cls):
+        """Resolve the scraper once for the class."""
+        cls.scraper_class = load_scraper(cls.SCRAPER)
+    
     def setUp(self):
         """Set up test environment."""
         self.config = {
@@ -843,40 +1100,7 @@ class TestCoverrScraper(unittest.TestCase):
             "request_delay": 0.01  # Fast for testing
         }
         
-        # Create the scraper with mocked methods
-        self.scraper = CoverrScraper(self.config)
-        
-        # Mock the _make_request method
-        self.make_request_patcher = patch.object(self.scraper, '_make_request')
-        self.mock_make_request = self.make_request_patcher.start()
-        
-        # Mock Selenium WebDriver
-        self.selenium_patcher = patch.object(self.scraper, '_init_selenium')
-        self.mock_selenium = self.selenium_patcher.start()
-        
-        self.close_selenium_patcher = patch.object(self.scraper, '_close_selenium')
-        self.mock_close_selenium = self.close_selenium_patcher.start()
-        
-        # Mock _get_video_details method
-        self.get_video_details_patcher = patch.object(self.scraper, '_get_video_details')
-        self.mock_get_video_details = self.get_video_details_patcher.start()
-        
-        # Mock driver
-        self.driver_patcher = patch.object(self.scraper, 'driver', create=True)
-        self.mock_driver = self.driver_patcher.start()
-        
-        # Mock BeautifulSoup
-        self.bs_patcher = patch('scrapers.coverr_scraper.BeautifulSoup')
-        self.mock_bs = self.bs_patcher.start()
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        self.make_request_patcher.stop()
-        self.selenium_patcher.stop()
-        self.close_selenium_patcher.stop()
-        self.get_video_details_patcher.stop()
-        self.driver_patcher.stop()
-        self.bs_patcher.stop()
+        self.scraper = self.scraper_class(self.config)
     
     def test_initialization(self):
         """Test scraper initialization."""
@@ -884,14 +1108,22 @@ class TestCoverrScraper(unittest.TestCase):
         self.assertEqual(self.scraper.base_url, self.config["base_url"])
         self.assertEqual(self.scraper.per_page, self.config["per_page"])
     
-    def test_search_videos(self):
+    # Network, Selenium and parsing are mocked on the class for this test only
+    @patch('scrapers.coverr_scraper.BeautifulSoup')
+    @patch('scrapers.coverr_scraper.CoverrScraper.driver', create=True)
+    @patch('scrapers.coverr_scraper.CoverrScraper._get_video_details')
+    @patch('scrapers.coverr_scraper.CoverrScraper._close_selenium')
+    @patch('scrapers.coverr_scraper.CoverrScraper._init_selenium')
+    @patch('scrapers.coverr_scraper.CoverrScraper._make_request')
+    def test_search_videos(self, mock_make_request, mock_init_selenium, mock_close_selenium,
+                           mock_get_video_details, mock_driver, mock_bs):
         """Test the search_videos method."""
         # Setup mock for driver page_source
-        self.mock_driver.page_source = "<html><body>Test page</body></html>"
+        mock_driver.page_source = "<html><body>Test page</body></html>"
         
         # Setup mock for BeautifulSoup
         mock_soup = MagicMock()
-        self.mock_bs.return_value = mock_soup
+        mock_bs.return_value = mock_soup
         
         # Setup mock for video items
         mock_item = MagicMock()
@@ -905,7 +1137,7 @@ class TestCoverrScraper(unittest.TestCase):
         mock_soup.select.return_value = [mock_item]
         
         # Setup mock for _get_video_details
-        self.mock_get_video_details.return_value = {
+        mock_get_video_details.return_value = {
             "download_url": "https://example.com/video.mp4",
             "width": 1920,
             "height": 1080,
@@ -930,34 +1162,27 @@ class TestCoverrScraper(unittest.TestCase):
 class TestNOAAScraper(unittest.TestCase):
     """Test cases for the NOAA scraper."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.config = {
+    SCRAPER = "scrapers.noaa_scraper:NOAAScraper"
+    
+    @classmethod
+    def setUpClass(cls):
+        """Resolve the scraper and patch the environment once for the class."""
+        cls.config = {
             "base_url": "https://www.ncdc.noaa.gov/cdo-web/api/v2/",
             "per_page": 10,
             "request_delay": 0.01  # Fast for testing
         }
         
-        # Mock environment variable
-        self.env_patcher = patch.dict('os.environ', {'NOAA_API_TOKEN': 'test_token'})
-        self.env_patcher.start()
-        
-        # Create the scraper with mocked methods
-        self.scraper = NOAAScraper(self.config)
-        
-        # Mock the _make_request method
-        self.make_request_patcher = patch.object(self.scraper, '_make_request')
-        self.mock_make_request = self.make_request_patcher.start()
+        cls.scraper_class = load_scraper(cls.SCRAPER)
         
-        # Mock the _get_video_details method
-        self.get_video_details_patcher = patch.object(self.scraper, '_get_video_details')
-        self.mock_get_video_details = self.get_video_details_patcher.start()
+        # Mock environment variable
+        env_patcher = patch.dict('os.environ', {'NOAA_API_TOKEN': 'test_token'})
+        env_patcher.start()
+        cls.addClassCleanup(env_patcher.stop)
     
-    def tearDown(self):
-        """Clean up after tests."""
-        self.make_request_patcher.stop()
-        self.get_video_details_patcher.stop()
-        self.env_patcher.stop()
+    def setUp(self):
+        """Set up test environment."""
+        self.scraper = self.scraper_class(self.config)
     
     def test_initialization(self):
         """Test scraper initialization."""
@@ -966,14 +1191,12 @@ class TestNOAAScraper(unittest.TestCase):
         self.assertEqual(self.scraper.per_page, self.config["per_page"])
         self.assertEqual(self.scraper.api_token, "test_token")
     
-    def test_search_videos(self):
+    @patch('scrapers.noaa_scraper.NOAAScraper._get_video_details')
+    @patch('scrapers.noaa_scraper.NOAAScraper._make_request')
+    def test_search_videos(self, mock_make_request, mock_get_video_details):
         """Test the search_videos method."""
         # Setup mock response for search
-        mock_search_response = MagicMock()
-        mock_search_response.status_code = 200
-        
-        # Mock JSON response
-        mock_search_response.json.return_value = {
+        mock_search_response = _json_response({
             "items": [
                 {
                     "id": "test-video",
@@ -984,10 +1207,10 @@ class TestNOAAScraper(unittest.TestCase):
                     "thumbnail": "https://example.com/thumbnail.jpg"
                 }
             ]
-        }
+        })
         
         # Setup mock for _get_video_details
-        self.mock_get_video_details.return_value = {
+        mock_get_video_details.return_value = {
             "download_url": "https://example.com/video.mp4",
             "width": 1920,
             "height": 1080,
@@ -997,7 +1220,7 @@ class TestNOAAScraper(unittest.TestCase):
         }
         
         # Configure mock to return response for search
-        self.mock_make_request.return_value = mock_search_response
+        mock_make_request.return_value = mock_search_response
         
         # Test search
         results = self.scraper.search_videos("weather")
@@ -1015,7 +1238,7 @@ class TestNOAAScraper(unittest.TestCase):
         """Test behavior when API token is missing."""
         # Remove API token from environment
         with patch.dict('os.environ', {}, clear=True):
-            scraper = NOAAScraper(self.config)
+            scraper = self.scraper_class(self.config)
             
             # Test search with missing API token
             results = scraper.search_videos("weather")
@@ -3,9 +3,11 @@ Test suite for cloud storage and batch processing modules.
 """
 
 import os
+import io
 import unittest
 import tempfile
 import json
+import hashlib
 from unittest.mock import patch, MagicMock, mock_open
 import logging
 
@@ -50,9 +52,11 @@ class TestCloudStorageUploader(unittest.TestCase):
         if os.path.exists(self.temp_file.name):
             os.unlink(self.temp_file.name)
         
-        # Remove test history file
-        if os.path.exists(self.config["upload_history_file"]):
-            os.unlink(self.config["upload_history_file"])
+        # Remove test history files
+        for history_file in (self.config["upload_history_file"], "test_upload_history.db",
+                             "test_upload_history.db-wal", "test_upload_history.db-shm"):
+            if os.path.exists(history_file):
+                os.unlink(history_file)
         
         # Stop environment patch
         self.env_patcher.stop()
@@ -77,6 +81,8 @@ class TestCloudStorageUploader(unittest.TestCase):
             aws_secret_access_key='test_secret',
             region_name='us-east-1'
         )
+        self.assertEqual(uploader.transfer_config.max_request_concurrency, 16)
+        self.assertEqual(uploader.transfer_config.multipart_chunksize, 16 * 1024 * 1024)
     
     @patch('storage.cloud_storage.boto3.client')
     @patch('storage.cloud_storage.open', new_callable=mock_open, read_data='{}')
@@ -96,8 +102,8 @@ class TestCloudStorageUploader(unittest.TestCase):
             "tags": ["test", "video"]
         }
         
-        # Ensure _is_already_uploaded returns False to force actual upload
-        with patch.object(CloudStorageUploader, '_is_already_uploaded', return_value=False):
+        # Ensure _find_uploaded_key finds nothing to force actual upload
+        with patch.object(CloudStorageUploader, '_find_uploaded_key', return_value=None):
             # Test upload
             result = uploader.upload_video(self.temp_file.name, metadata)
             
@@ -145,8 +151,8 @@ class TestCloudStorageUploader(unittest.TestCase):
         config["max_retries"] = 1
         uploader = CloudStorageUploader(config)
         
-        # Ensure _is_already_uploaded returns False to force actual upload
-        with patch.object(CloudStorageUploader, '_is_already_uploaded', return_value=False):
+        # Ensure _find_uploaded_key finds nothing to force actual upload
+        with patch.object(CloudStorageUploader, '_find_uploaded_key', return_value=None):
             # Test upload
             result = uploader.upload_video(self.temp_file.name, {})
             
@@ -194,8 +200,228 @@ class TestCloudStorageUploader(unittest.TestCase):
         # Verify S3 upload was not called
         mock_client.upload_file.assert_not_called()
     
+    @patch('storage.cloud_storage.boto3.client')
+    def test_upload_videos(self, mock_boto_client):
+        """Test uploading several videos concurrently."""
+        mock_client = MagicMock()
+        mock_boto_client.return_value = mock_client
+        
+        uploader = CloudStorageUploader(self.config)
+        with patch.object(CloudStorageUploader, '_find_uploaded_key', return_value=None):
+            results = uploader.upload_videos([
+                (self.temp_file.name, {"title": "Test Video"}),
+                ("nonexistent_file.mp4", {})
+            ])
+        uploader.close()
+        
+        # Results keep input order
+        self.assertEqual(len(results), 2)
+        self.assertTrue(results[0][0])
+        self.assertFalse(results[1][0])
+        mock_client.upload_file.assert_called_once()
+    
+    @patch('storage.cloud_storage.boto3.client')
+    def test_upload_stream(self, mock_boto_client):
+        """Test uploading directly from a stream."""
+        from botocore.exceptions import ClientError
+        mock_client = MagicMock()
+        mock_client.head_object.side_effect = ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        mock_boto_client.return_value = mock_client
+        
+        uploader = CloudStorageUploader(self.config)
+        stream = io.BytesIO(b"test video content")
+        success, url = uploader.upload_stream(stream, "downloads_clip.webm", {"title": "Test Video"})
+        
+        self.assertTrue(success)
+        self.assertEqual(url, "https://test-bucket.s3.amazonaws.com/videos/clip.webm")
+        args, kwargs = mock_client.upload_fileobj.call_args
+        self.assertIs(args[0], stream)
+        self.assertEqual(args[2], "videos/clip.webm")
+        self.assertIs(kwargs["Config"], uploader.transfer_config)
+        
+        # Streaming the same key again is deduplicated through the remote object index
+        self.assertEqual(uploader.upload_stream(io.BytesIO(b"test video content"), "clip.webm"), (True, url))
+        mock_client.upload_fileobj.assert_called_once()
+        uploader.close()
+    
+    @patch('storage.cloud_storage.boto3.client')
+    def test_upload_history_database(self, mock_boto_client):
+        """Test that uploads are recorded in and looked up from the SQLite history."""
+        mock_client = MagicMock()
+        mock_client.head_object.side_effect = Exception("Not found")
+        mock_boto_client.return_value = mock_client
+        
+        uploader = CloudStorageUploader(self.config)
+        cloud_key = f"videos/{os.path.basename(self.temp_file.name)}"
+        self.assertIsNone(uploader._find_uploaded_key(self.temp_file.name, cloud_key))
+        
+        uploader._record_upload(self.temp_file.name, cloud_key, {"title": "Test Video"})
+        self.assertEqual(uploader._find_uploaded_key(self.temp_file.name, cloud_key), cloud_key)
+        uploader.close()
+        
+        # History persists across uploader instances
+        uploader = CloudStorageUploader(self.config)
+        self.assertEqual(uploader._find_uploaded_key(self.temp_file.name, cloud_key), cloud_key)
+        uploader.close()
+    
+    @patch('storage.cloud_storage.boto3.client')
+    def test_duplicate_content_returns_existing_object(self, mock_boto_client):
+        """Test that re-uploading the same content under another name returns the stored object's URL."""
+        from botocore.exceptions import ClientError
+        stored = set()
+
+        def head_object(Bucket, Key):
+            if Key not in stored:
+                raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+            return {}
+
+        mock_client = MagicMock()
+        mock_client.upload_file.side_effect = lambda path, bucket, key, **kwargs: stored.add(key)
+        mock_client.head_object.side_effect = head_object
+        mock_boto_client.return_value = mock_client
+
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as copy_file:
+            copy_file.write(b"test video content")
+        uploader = CloudStorageUploader(self.config)
+        try:
+            first = uploader.upload_video(self.temp_file.name)
+            second = uploader.upload_video(copy_file.name)
+        finally:
+            os.unlink(copy_file.name)
+            uploader.close()
+
+        self.assertEqual(first, (True, f"https://test-bucket.s3.amazonaws.com/videos/{os.path.basename(self.temp_file.name)}"))
+        self.assertEqual(second, first)
+        mock_client.upload_file.assert_called_once()
+        self.assertEqual(stored, {second[1].split(".s3.amazonaws.com/", 1)[1]})
+
+    @patch('storage.cloud_storage.boto3.client')
+    def test_head_object_cache(self, mock_boto_client):
+        """Test that head_object results are cached between dedup checks."""
+        from botocore.exceptions import ClientError
+        mock_client = MagicMock()
+        mock_client.head_object.side_effect = ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        mock_boto_client.return_value = mock_client
+
+        uploader = CloudStorageUploader(self.config)
+        cloud_key = "videos/missing.mp4"
+        self.assertIsNone(uploader._find_uploaded_key(self.temp_file.name, cloud_key))
+        self.assertIsNone(uploader._find_uploaded_key(self.temp_file.name, cloud_key))
+        mock_client.head_object.assert_called_once()
+
+        # Transient errors are not remembered
+        mock_client.head_object.side_effect = ClientError({"Error": {"Code": "503"}}, "HeadObject")
+        self.assertIsNone(uploader._find_uploaded_key(self.temp_file.name, "videos/other.mp4"))
+        self.assertNotIn("videos/other.mp4", uploader._head_cache)
+        uploader.close()
+
+    @patch('storage.cloud_storage.boto3.client')
+    def test_rebuild_index(self, mock_boto_client):
+        """Test that objects listed in the bucket count as uploaded when their size matches."""
+        mock_client = MagicMock()
+        mock_client.head_object.side_effect = Exception("Not found")
+        pages = [
+            {"Contents": [{"Key": "videos/a.mp4", "Size": len(b"test video content"), "ETag": '"abc"'}]},
+            {"Contents": [{"Key": "videos/b.mp4", "Size": 1, "ETag": '"def"'}]}
+        ]
+
+        def paginate(**kwargs):
+            # The listing is paged before the history lock is taken
+            for page in pages:
+                self.assertFalse(uploader._history_lock.locked())
+                yield page
+
+        mock_client.get_paginator.return_value.paginate.side_effect = paginate
+        mock_boto_client.return_value = mock_client
+
+        uploader = CloudStorageUploader(self.config)
+        self.assertEqual(uploader.rebuild_index(), 2)
+        mock_client.get_paginator.assert_called_once_with("list_objects_v2")
+
+        self.assertEqual(uploader._find_uploaded_key(self.temp_file.name, "videos/a.mp4"), "videos/a.mp4")
+        self.assertIsNone(uploader._find_uploaded_key(self.temp_file.name, "videos/b.mp4"))
+        uploader.close()
+
+    @patch('storage.cloud_storage.storage.Client')
+    def test_gcp_bucket_resolved_once(self, mock_gcs_client):
+        """Test that the GCS bucket handle is created once and reused for uploads."""
+        mock_client = MagicMock()
+        mock_gcs_client.return_value = mock_client
+
+        uploader = CloudStorageUploader(dict(self.config, provider="gcp"))
+        uploader.upload_stream(io.BytesIO(b"one"), "one.webm")
+        uploader.upload_stream(io.BytesIO(b"two"), "two.webm")
+
+        mock_client.bucket.assert_called_once_with("test-bucket")
+        self.assertEqual(mock_client.bucket.return_value.blob.call_count, 2)
+        uploader.close()
+
+    @patch('storage.cloud_storage.boto3.client')
+    def test_file_hash_is_content_based(self, mock_boto_client):
+        """Test that the file hash follows content, not path."""
+        mock_boto_client.return_value = MagicMock()
+        uploader = CloudStorageUploader(self.config)
+        
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as copy_file:
+            copy_file.write(b"test video content")
+        try:
+            self.assertEqual(uploader._get_file_hash(self.temp_file.name), uploader._get_file_hash(copy_file.name))
+            self.assertEqual(uploader._get_file_hash(self.temp_file.name),
+                             hashlib.blake2b(b"test video content", digest_size=32).hexdigest())
+        finally:
+            os.unlink(copy_file.name)
+            uploader.close()
+
+    @patch('storage.cloud_storage.boto3.client')
+    def test_hash_cache_is_bounded(self, mock_boto_client):
+        """Test that memoized file hashes are evicted beyond hash_cache_size."""
+        mock_boto_client.return_value = MagicMock()
+        uploader = CloudStorageUploader(dict(self.config, hash_cache_size=1))
+
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as other_file:
+            other_file.write(b"other video content")
+        try:
+            uploader._get_file_hash(self.temp_file.name)
+            uploader._get_file_hash(other_file.name)
+            self.assertEqual(len(uploader._hash_cache), 1)
+        finally:
+            os.unlink(other_file.name)
+            uploader.close()
+
+    @patch('storage.cloud_storage.boto3.client')
+    def test_legacy_history_import(self, mock_boto_client):
+        """Test that an existing JSON upload history is imported on first run."""
+        mock_client = MagicMock()
+        mock_client.head_object.side_effect = Exception("Not found")
+        mock_boto_client.return_value = mock_client
+        
+        with open(self.config["upload_history_file"], "w") as f:
+            json.dump({
+                self._get_file_hash(self.temp_file.name): {
+                    "local_path": self.temp_file.name,
+                    "cloud_key": "videos/legacy.mp4",
+                    "provider": "aws",
+                    "bucket": "test-bucket",
+                    "timestamp": 1621555555.0
+                },
+                "0" * 32: {
+                    "local_path": self.temp_file.name + ".deleted",
+                    "cloud_key": "videos/deleted.mp4",
+                    "provider": "aws",
+                    "bucket": "test-bucket",
+                    "timestamp": 1621555555.0
+                }
+            }, f)
+        
+        # Entries are rehashed from their file; ones whose file is gone are dropped
+        uploader = CloudStorageUploader(self.config)
+        self.assertEqual(uploader._find_uploaded_key(self.temp_file.name, "videos/new.mp4"), "videos/legacy.mp4")
+        self.assertEqual(uploader._history_conn.execute("SELECT cloud_key FROM uploads").fetchall(),
+                         [("videos/legacy.mp4",)])
+        uploader.close()
+    
     def _get_file_hash(self, file_path):
-        """Helper to generate file hash similar to the uploader."""
+        """Helper to generate the key of the legacy JSON upload history."""
         import hashlib
         stat = os.stat(file_path)
         file_info = f"{file_path}:{stat.st_size}:{stat.st_mtime}"
@@ -307,6 +533,8 @@ class TestBatchProcessor(unittest.TestCase):
     
     def tearDown(self):
         """Clean up after tests."""
+        self.processor.close()
+        
         # Remove test directories
         import shutil
         shutil.rmtree(self.test_dir)
@@ -320,7 +548,51 @@ class TestBatchProcessor(unittest.TestCase):
         self.assertEqual(self.processor.max_workers, 2)
         self.assertEqual(len(self.processor.scrapers), 1)
         self.assertIn("mock", self.processor.scrapers)
-    
+
+    def test_save_state(self):
+        """Test that batch state is written compactly and swapped into place."""
+        self.processor.state["batches"]["batch1"] = {"status": "completed", "videos": ["video1"]}
+        self.processor._save_state()
+
+        with open(self.config["state_file"], "r") as f:
+            content = f.read()
+        self.assertNotIn("\n", content)
+        self.assertEqual(json.loads(content)["batches"]["batch1"]["status"], "completed")
+        self.assertFalse(os.path.exists(self.config["state_file"] + ".tmp"))
+        reloaded = BatchProcessor(self.config)
+        self.addCleanup(reloaded.close)
+        self.assertEqual(reloaded.state["batches"], self.processor.state["batches"])
+
+    def test_save_state_debounced(self):
+        """Test that saves within the flush interval are coalesced into a later write."""
+        self.processor.state_flush_interval = 60
+        self.processor._save_state()
+        self.processor.state["batches"]["batch1"] = {"status": "running"}
+        self.processor._save_state()
+
+        # The second save is pending on the timer
+        with open(self.config["state_file"], "r") as f:
+            self.assertNotIn("batch1", json.load(f)["batches"])
+        self.assertIsNotNone(self.processor._state_flush_timer)
+
+        self.processor.close()
+        with open(self.config["state_file"], "r") as f:
+            self.assertIn("batch1", json.load(f)["batches"])
+        self.assertIsNone(self.processor._state_flush_timer)
+
+    def test_context_manager_flushes_pending_state(self):
+        """Test that leaving a with block writes a save still waiting on the timer."""
+        with BatchProcessor(self.config) as processor:
+            processor.state_flush_interval = 60
+            processor._save_state()
+            processor.state["batches"]["batch2"] = {"status": "running"}
+            processor._save_state()
+            self.assertIsNotNone(processor._state_flush_timer)
+
+        with open(self.config["state_file"], "r") as f:
+            self.assertIn("batch2", json.load(f)["batches"])
+        self.assertIsNone(processor._state_flush_timer)
+
     @patch('processors.batch_processor.as_completed')
     @patch('processors.batch_processor.ThreadPoolExecutor')
     def test_process_batch(self, mock_executor, mock_as_completed):
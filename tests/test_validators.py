@@ -434,6 +434,20 @@ class TestValidationPipeline(unittest.TestCase):
         }
         self.pipeline = ValidationPipeline(self.config)
     
+    @patch('validators.validation_pipeline.TextDetectionValidator')
+    def test_lazy_validators(self, mock_text_validator):
+        """Test that a lazy pipeline builds its validators on first use."""
+        pipeline = ValidationPipeline(self.config, lazy=True)
+        
+        # Nothing is constructed until a video is validated
+        mock_text_validator.assert_not_called()
+        self.assertFalse(hasattr(pipeline, "text_validator"))
+        
+        pipeline.validate("nonexistent_video.mp4")
+        
+        mock_text_validator.assert_called_once_with(self.config["text_detection"])
+        self.assertIs(pipeline.text_validator, mock_text_validator.return_value)
+    
     @patch('validators.validation_pipeline.os.path.exists')
     def test_validate_nonexistent_video(self, mock_exists):
         """Test validation with non-existent video file."""
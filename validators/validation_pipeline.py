@@ -18,27 +18,36 @@ logger = logging.getLogger(__name__)
 class ValidationPipeline:
     """Unified pipeline for validating video content against all requirements."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], lazy: bool = False):
         """
         Initialize the validation pipeline with configuration.
         
         Args:
             config: Dictionary containing validator configurations
+            lazy: Defer building the validators until the first validation
         """
         self.config = config
         self.logger = logging.getLogger("validator.pipeline")
         
         # Initialize individual validators
-        self.text_validator = TextDetectionValidator(config.get("text_detection", {}))
-        self.cut_scene_validator = CutSceneDetectionValidator(config.get("cut_scene", {}))
-        self.resolution_validator = ResolutionValidator(config.get("resolution", {}))
-        self.ai_content_validator = AIGeneratedContentValidator(config.get("ai_content", {}))
-        self.physics_validator = PhysicsRealismValidator(config.get("physics", {}))
+        self.lazy = lazy
+        self._validators_built = False
+        if not lazy:
+            self._build_validators()
         
         # Configure validation log
         self.log_file = config.get("log_file", "validation.log")
         self.detailed_logs = config.get("detailed_logs", True)
     
+    def _build_validators(self):
+        """Construct the individual validators from the pipeline configuration."""
+        self.text_validator = TextDetectionValidator(self.config.get("text_detection", {}))
+        self.cut_scene_validator = CutSceneDetectionValidator(self.config.get("cut_scene", {}))
+        self.resolution_validator = ResolutionValidator(self.config.get("resolution", {}))
+        self.ai_content_validator = AIGeneratedContentValidator(self.config.get("ai_content", {}))
+        self.physics_validator = PhysicsRealismValidator(self.config.get("physics", {}))
+        self._validators_built = True
+    
     def validate(self, video_path: str, metadata: Dict[str, Any] = None) -> Tuple[bool, Dict[str, Any]]:
         """
         Alias for validate_video for backward compatibility with tests.
@@ -64,6 +73,9 @@ class ValidationPipeline:
             Tuple of (is_valid, validation_results)
         """
         try:
+            if not self._validators_built:
+                self._build_validators()
+            
             self.logger.info(f"Starting validation for video: {video_path}")
             # Initialize results dictionary
             results = {